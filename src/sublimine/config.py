@@ -1,12 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+import os
+from dataclasses import MISSING, dataclass, fields
+from operator import itemgetter
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True, kw_only=True)
 class SymbolsConfig:
     leader: str
     exec_symbol: str
@@ -16,7 +25,7 @@ class SymbolsConfig:
         return self.exec_symbol
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, kw_only=True)
 class ThresholdsConfig:
     window: int
     depth_k: int
@@ -71,19 +80,19 @@ class ThresholdsConfig:
     health_risk_scale_degraded: float = 0.50
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, kw_only=True)
 class RiskPhaseConfig:
     risk_frac: float
     max_daily_loss: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, kw_only=True)
 class RiskConfig:
-    phases: dict[str, RiskPhaseConfig]
+    phases: Mapping[str, RiskPhaseConfig]
     active_phase: str = "F0"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, kw_only=True)
 class LiveConfig:
     out_dir: str
     journal_filename: str
@@ -95,7 +104,7 @@ class LiveConfig:
     binance_depth_interval_ms: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, kw_only=True)
 class EngineConfig:
     symbols: SymbolsConfig
     thresholds: ThresholdsConfig
@@ -103,85 +112,83 @@ class EngineConfig:
     live: LiveConfig | None = None
 
 
-def _require(data: dict, key: str) -> Any:
-    if key not in data:
-        raise KeyError(f"Missing config key: {key}")
-    return data[key]
+_CASTS: dict[str, Callable[[Any], Any]] = {"int": int, "float": float, "str": str}
+
+_THRESH_DEFAULTS: dict[str, Any] = {
+    **{f.name: f.default for f in fields(ThresholdsConfig) if f.default is not MISSING},
+    "consensus_window_ms": 750,
+    "max_stale_ms": 2000,
+}
+
+_THRESH_SPEC: tuple[tuple[str, Callable[[Any], Any], Any], ...] = tuple(
+    (f.name, _CASTS[f.type], _THRESH_DEFAULTS.get(f.name)) for f in fields(ThresholdsConfig)
+)
+
+_RISK_PHASE_SPEC: tuple[tuple[str, Callable[[Any], Any], Any], ...] = (
+    ("risk_frac", float, None),
+    ("max_daily_loss", float, None),
+)
+
+_LIVE_SPEC: tuple[tuple[str, Callable[[Any], Any], Any], ...] = (
+    ("out_dir", str, "_out/live"),
+    ("bybit_ws", str, "wss://stream.bybit.com/v5/public/spot"),
+    ("bybit_depth", int, 50),
+    ("binance_ws", str, "wss://stream.binance.com:9443/ws"),
+    ("binance_rest", str, "https://api.binance.com/api/v3/depth"),
+    ("binance_depth", int, 50),
+    ("binance_depth_interval_ms", int, 100),
+)
+
+
+_ROOT_KEYS = itemgetter("symbols", "thresholds", "risk_phases")
+_SYMBOLS_KEYS = itemgetter("leader", "exec")
+
+
+def _require(data: dict, keys: itemgetter) -> Any:
+    try:
+        return keys(data)
+    except KeyError as exc:
+        raise KeyError(f"Missing config key: {exc.args[0]}") from None
+
+
+def _build_fields(data: dict, spec: tuple[tuple[str, Callable[[Any], Any], Any], ...]) -> dict[str, Any]:
+    try:
+        return {name: cast(data[name] if default is None else data.get(name, default)) for name, cast, default in spec}
+    except KeyError as exc:
+        raise KeyError(f"Missing config key: {exc.args[0]}") from None
+
+
+_CFG_CACHE: dict[str, tuple[int, int, EngineConfig]] = {}
 
 
 def load_config(path: str) -> EngineConfig:
-    with open(path, "r", encoding="utf-8") as handle:
-        raw = yaml.safe_load(handle) or {}
+    st = os.stat(path)
+    key = os.path.abspath(path)
+    cached = _CFG_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
 
-    symbols_raw = _require(raw, "symbols")
-    thresholds_raw = _require(raw, "thresholds")
-    risk_raw = _require(raw, "risk_phases")
+    raw = yaml.load(Path(path).read_bytes(), Loader=_YamlLoader) or {}
+    config = _build_config(raw)
+    _CFG_CACHE[key] = (st.st_mtime_ns, st.st_size, config)
+    return config
 
-    symbols = SymbolsConfig(
-        leader=str(_require(symbols_raw, "leader")),
-        exec_symbol=str(_require(symbols_raw, "exec")),
-    )
 
-    thresholds = ThresholdsConfig(
-        window=int(_require(thresholds_raw, "window")),
-        depth_k=int(_require(thresholds_raw, "depth_k")),
-        quantile_high=float(_require(thresholds_raw, "quantile_high")),
-        quantile_low=float(_require(thresholds_raw, "quantile_low")),
-        min_samples=int(_require(thresholds_raw, "min_samples")),
-        signal_score_min=float(_require(thresholds_raw, "signal_score_min")),
-        consensus_window_ms=int(thresholds_raw.get("consensus_window_ms", 750)),
-        max_stale_ms=int(thresholds_raw.get("max_stale_ms", 2000)),
-        bar_interval_ms=int(thresholds_raw.get("bar_interval_ms", 500)),
-        dlv_pre_bars=int(thresholds_raw.get("dlv_pre_bars", 20)),
-        dlv_run_bars=int(thresholds_raw.get("dlv_run_bars", 4)),
-        dlv_pause_bars=int(thresholds_raw.get("dlv_pause_bars", 2)),
-        dlv_max_overlap_ratio=float(thresholds_raw.get("dlv_max_overlap_ratio", 0.20)),
-        dlv_max_counter_wick_ratio=float(thresholds_raw.get("dlv_max_counter_wick_ratio", 0.25)),
-        dlv_max_close_off_ratio=float(thresholds_raw.get("dlv_max_close_off_ratio", 0.20)),
-        dlv_pause_range_ratio=float(thresholds_raw.get("dlv_pause_range_ratio", 0.40)),
-        dlv_retest_tolerance_bps=float(thresholds_raw.get("dlv_retest_tolerance_bps", 0.0)),
-        afs_pre_bars=int(thresholds_raw.get("afs_pre_bars", 20)),
-        afs_sweep_bps=float(thresholds_raw.get("afs_sweep_bps", 10.0)),
-        afs_hold_bars_max=int(thresholds_raw.get("afs_hold_bars_max", 3)),
-        afs_consol_range_ratio=float(thresholds_raw.get("afs_consol_range_ratio", 0.50)),
-        afs_followthrough_max_bps=float(thresholds_raw.get("afs_followthrough_max_bps", 5.0)),
-        saf_level_bars=int(thresholds_raw.get("saf_level_bars", 20)),
-        saf_window_ms=int(thresholds_raw.get("saf_window_ms", 8000)),
-        saf_min_attacks=int(thresholds_raw.get("saf_min_attacks", 4)),
-        saf_level_tolerance_bps=float(thresholds_raw.get("saf_level_tolerance_bps", 10.0)),
-        saf_max_return_bps=float(thresholds_raw.get("saf_max_return_bps", 3.0)),
-        saf_min_replenishment=float(thresholds_raw.get("saf_min_replenishment", 0.5)),
-        saf_min_ofi_abs=float(thresholds_raw.get("saf_min_ofi_abs", 0.5)),
-        saf_reach_worsen_bps=float(thresholds_raw.get("saf_reach_worsen_bps", 1.0)),
-        saf_ofi_decay_ratio=float(thresholds_raw.get("saf_ofi_decay_ratio", 0.7)),
-        per_ttl_bars=int(thresholds_raw.get("per_ttl_bars", 30)),
-        per_min_hold_bps=float(thresholds_raw.get("per_min_hold_bps", 10.0)),
-        per_max_pullback_bps=float(thresholds_raw.get("per_max_pullback_bps", 80.0)),
-        per_trigger_break=str(thresholds_raw.get("per_trigger_break", "bar_break")),
-        rlb_window_ms=int(thresholds_raw.get("rlb_window_ms", 10000)),
-        rlb_spike_bps=float(thresholds_raw.get("rlb_spike_bps", 15.0)),
-        max_mid_diff_bps=float(thresholds_raw.get("max_mid_diff_bps", 25.0)),
-        health_eps_window_ms=int(thresholds_raw.get("health_eps_window_ms", 5000)),
-        health_rate_window_ms=int(thresholds_raw.get("health_rate_window_ms", 60000)),
-        health_min_eps=float(thresholds_raw.get("health_min_eps", 5.0)),
-        health_max_resync_per_min=float(thresholds_raw.get("health_max_resync_per_min", 6.0)),
-        health_max_desync_per_min=float(thresholds_raw.get("health_max_desync_per_min", 6.0)),
-        health_max_gaps_in_window=int(thresholds_raw.get("health_max_gaps_in_window", 3)),
-        health_max_queue_depth=int(thresholds_raw.get("health_max_queue_depth", 5000)),
-        health_degraded_score=float(thresholds_raw.get("health_degraded_score", 0.85)),
-        health_freeze_score=float(thresholds_raw.get("health_freeze_score", 0.60)),
-        health_kill_score=float(thresholds_raw.get("health_kill_score", 0.30)),
-        health_recover_score=float(thresholds_raw.get("health_recover_score", 0.90)),
-        health_recover_window_ms=int(thresholds_raw.get("health_recover_window_ms", 5000)),
-        health_risk_scale_degraded=float(thresholds_raw.get("health_risk_scale_degraded", 0.50)),
-    )
+def clear_config_cache() -> None:
+    _CFG_CACHE.clear()
+
+
+def _build_config(raw: dict) -> EngineConfig:
+    symbols_raw, thresholds_raw, risk_raw = _require(raw, _ROOT_KEYS)
+
+    leader, exec_symbol = _require(symbols_raw, _SYMBOLS_KEYS)
+    symbols = SymbolsConfig(leader=str(leader), exec_symbol=str(exec_symbol))
+
+    thresholds = ThresholdsConfig(**_build_fields(thresholds_raw, _THRESH_SPEC))
 
     phases = {}
     for name, values in risk_raw.items():
-        phases[str(name)] = RiskPhaseConfig(
-            risk_frac=float(_require(values, "risk_frac")),
-            max_daily_loss=float(_require(values, "max_daily_loss")),
-        )
+        phases[str(name)] = RiskPhaseConfig(**_build_fields(values, _RISK_PHASE_SPEC))
 
     active_phase = str(raw.get("risk", {}).get("active_phase", "F0"))
     if active_phase not in phases:
@@ -189,20 +196,12 @@ def load_config(path: str) -> EngineConfig:
             active_phase = "F0"
         elif phases:
             active_phase = sorted(phases.keys())[0]
-    risk = RiskConfig(phases=phases, active_phase=active_phase)
+    risk = RiskConfig(phases=MappingProxyType(phases), active_phase=active_phase)
 
     live_raw = raw.get("live", {}) or {}
-    out_dir = str(live_raw.get("out_dir", "_out/live"))
-    journal_filename = str(live_raw.get("journal_filename", f"{symbols.leader.lower()}_live.jsonl"))
     live = LiveConfig(
-        out_dir=out_dir,
-        journal_filename=journal_filename,
-        bybit_ws=str(live_raw.get("bybit_ws", "wss://stream.bybit.com/v5/public/spot")),
-        bybit_depth=int(live_raw.get("bybit_depth", 50)),
-        binance_ws=str(live_raw.get("binance_ws", "wss://stream.binance.com:9443/ws")),
-        binance_rest=str(live_raw.get("binance_rest", "https://api.binance.com/api/v3/depth")),
-        binance_depth=int(live_raw.get("binance_depth", 50)),
-        binance_depth_interval_ms=int(live_raw.get("binance_depth_interval_ms", 100)),
+        journal_filename=str(live_raw.get("journal_filename", f"{symbols.leader.lower()}_live.jsonl")),
+        **_build_fields(live_raw, _LIVE_SPEC),
     )
 
     return EngineConfig(symbols=symbols, thresholds=thresholds, risk=risk, live=live)
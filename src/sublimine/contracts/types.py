@@ -31,13 +31,13 @@ class Side(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BookLevel:
     price: float
     size: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BookSnapshot:
     symbol: str
     venue: Venue
@@ -47,7 +47,7 @@ class BookSnapshot:
     depth: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BookDelta:
     symbol: str
     venue: Venue
@@ -58,7 +58,7 @@ class BookDelta:
     update_id: int | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradePrint:
     symbol: str
     venue: Venue
@@ -68,7 +68,7 @@ class TradePrint:
     aggressor_side: Side
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QuoteTick:
     symbol: str
     venue: Venue
@@ -78,7 +78,7 @@ class QuoteTick:
     last: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignalEvent:
     event_name: Literal["E1", "E2", "E3", "E4"]
     symbol: str
@@ -89,7 +89,7 @@ class SignalEvent:
     meta: dict = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradeIntent:
     symbol: str
     direction: Side
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Callable, DefaultDict
+from typing import Callable
 
 from sublimine.contracts.types import EventType
 
@@ -10,11 +9,15 @@ EventHandler = Callable[[object], None]
 
 class EventBus:
     def __init__(self) -> None:
-        self._subscribers: DefaultDict[EventType, list[EventHandler]] = defaultdict(list)
+        self._subscribers: dict[EventType, tuple[EventHandler, ...]] = {event_type: () for event_type in EventType}
 
     def subscribe(self, event_type: EventType, handler: EventHandler) -> None:
-        self._subscribers[event_type].append(handler)
+        self._subscribers[event_type] = self._subscribers.get(event_type, ()) + (handler,)
 
     def publish(self, event_type: EventType, payload: object) -> None:
-        for handler in list(self._subscribers.get(event_type, [])):
+        try:
+            handlers = self._subscribers[event_type]
+        except KeyError:
+            return
+        for handler in handlers:
             handler(payload)
@@ -5,6 +5,8 @@ from datetime import datetime, timezone
 import time
 from typing import Protocol
 
+_UTC = timezone.utc
+
 
 class Clock(Protocol):
     def utc_now(self) -> datetime:
@@ -17,7 +19,7 @@ class Clock(Protocol):
 @dataclass(frozen=True)
 class SystemClock:
     def utc_now(self) -> datetime:
-        return datetime.now(timezone.utc)
+        return datetime.now(_UTC)
 
     def monotonic_ns(self) -> int:
         return time.monotonic_ns()
@@ -36,7 +38,7 @@ class FixedClock:
 
 
 def utc_now() -> datetime:
-    return datetime.now(timezone.utc)
+    return datetime.now(_UTC)
 
 
 def monotonic_ns() -> int:
@@ -11,9 +11,18 @@ class IdGenerator:
     prefix: str
     counter: int = 0
 
+    def __post_init__(self) -> None:
+        self._build_format()
+
+    def _build_format(self) -> None:
+        self._format_prefix = self.prefix
+        self._format = self.prefix.replace("%", "%%") + "%06d"
+
     def next_id(self) -> str:
         self.counter += 1
-        return f"{self.prefix}{self.counter:06d}"
+        if self.prefix is not self._format_prefix:
+            self._build_format()
+        return self._format % self.counter
 
 
 def run_id(ts_utc: datetime | None = None) -> str:
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import json
+import re
+from math import isfinite
+from operator import attrgetter
 from dataclasses import fields, is_dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
+
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - exercised without orjson installed
+    orjson = None
 
 from sublimine.contracts.types import (
     BookDelta,
@@ -37,17 +45,196 @@ def _encode_value(value: Any) -> Any:
     return value
 
 
+_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
 def _encode_dataclass(obj: Any) -> dict:
-    return {field.name: _encode_value(getattr(obj, field.name)) for field in fields(obj)}
+    cls = type(obj)
+    encoder = _ENCODERS.get(cls)
+    if encoder is not None:
+        return encoder(obj)
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = tuple(field.name for field in fields(cls))
+        _FIELD_NAMES[cls] = names
+    return {name: _encode_value(getattr(obj, name)) for name in names}
+
+
+_FIELD_EXPRS = {
+    "str": "o.{0}",
+    "int": "o.{0}",
+    "float": "o.{0}",
+    "bool": "o.{0}",
+    "Venue": "o.{0}.value",
+    "Side": "o.{0}.value",
+    "datetime": "o.{0}.isoformat()",
+    "list[BookLevel]": '[{{"price": level.price, "size": level.size}} for level in o.{0}]',
+}
+
+
+def _build_encoder(cls: type, field_exprs: dict[str, str] = _FIELD_EXPRS) -> Callable[[Any], dict]:
+    items = []
+    for field in fields(cls):
+        annotation = field.type if isinstance(field.type, str) else getattr(field.type, "__name__", "")
+        expr = field_exprs.get(annotation, "_encode_value(o.{0})").format(field.name)
+        items.append(f"{field.name!r}: {expr}")
+    namespace: dict[str, Any] = {"_encode_value": _encode_value, "_UTC": timezone.utc}
+    exec(f"def _encode(o):\n    return {{{', '.join(items)}}}\n", namespace)
+    return namespace["_encode"]
+
+
+_ENCODED_TYPES = (
+    BookLevel,
+    BookSnapshot,
+    BookDelta,
+    TradePrint,
+    QuoteTick,
+    SignalEvent,
+    TradeIntent,
+    FeatureFrame,
+    DataQualitySnapshot,
+    EngineStateEvent,
+)
+
+_ENCODERS: dict[type, Callable[[Any], dict]] = {cls: _build_encoder(cls) for cls in _ENCODED_TYPES}
+
+# JournalWriter hands UTC timestamps to orjson as datetimes; orjson renders those
+# with the same text as isoformat(), but it rounds sub-minute offsets, so any other
+# tzinfo still goes through isoformat(). encode_record stays JSON-native.
+if orjson is not None:
+    _WRITER_FIELD_EXPRS = {**_FIELD_EXPRS, "datetime": "(o.{0} if o.{0}.tzinfo is _UTC else o.{0}.isoformat())"}
+    _WRITER_ENCODERS: dict[type, Callable[[Any], dict]] = {
+        cls: _build_encoder(cls, _WRITER_FIELD_EXPRS) for cls in _ENCODED_TYPES
+    }
+else:  # pragma: no cover - exercised without orjson installed
+    _WRITER_ENCODERS = _ENCODERS
 
 
 def encode_record(event_type: EventType, payload: Any) -> dict:
     return {
         "event_type": event_type.value,
-        "data": _encode_value(payload),
+        "data": _ENCODERS.get(type(payload), _encode_value)(payload),
     }
 
 
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+def _is_finite_value(value: Any) -> bool:
+    if isinstance(value, float):
+        return isfinite(value)
+    if isinstance(value, (list, tuple)):
+        return all(map(_is_finite_value, value))
+    if isinstance(value, dict):
+        return all(map(_is_finite_value, value.values()))
+    return True
+
+
+_PRICE = attrgetter("price")
+_SIZE = attrgetter("size")
+
+
+def _level_sum(levels: list[BookLevel]) -> float:
+    return sum(map(_PRICE, levels), sum(map(_SIZE, levels)))
+
+
+# Fields that can never hold a float. Float fields are summed (NaN/inf propagate;
+# an overflowing sum only costs a stdlib encode), everything else is walked.
+_FINITE_SKIP = {"str", "int", "bool", "Venue", "Side", "datetime", "int | None", "list[str]"}
+
+
+def _build_finite_check(cls: type) -> Callable[[Any], bool]:
+    terms = ["0.0"]
+    checks = []
+    for field in fields(cls):
+        annotation = field.type if isinstance(field.type, str) else getattr(field.type, "__name__", "")
+        if annotation == "float":
+            terms.append(f"o.{field.name}")
+        elif annotation == "list[BookLevel]":
+            terms.append(f"_level_sum(o.{field.name})")
+        elif annotation not in _FINITE_SKIP and not annotation.startswith("Literal["):
+            checks.append(f"_is_finite_value(o.{field.name})")
+    body = " and ".join([f"_isfinite({' + '.join(terms)})", *checks])
+    namespace: dict[str, Any] = {"_isfinite": isfinite, "_level_sum": _level_sum, "_is_finite_value": _is_finite_value}
+    exec(f"def _finite(o):\n    return {body}\n", namespace)
+    return namespace["_finite"]
+
+
+if orjson is not None:
+    # orjson writes NaN/inf as null and rejects ints wider than 64 bits, and its
+    # loads() turns such ints into floats. Those payloads go through the stdlib.
+    _WIDE_INT = re.compile(rb"\d{19}")
+    _FINITE_CHECKS: dict[type, Callable[[Any], bool]] = {cls: _build_finite_check(cls) for cls in _ENCODED_TYPES}
+
+    def _dumps_payload(payload: Any) -> bytes:
+        cls = type(payload)
+        encoder = _WRITER_ENCODERS.get(cls)
+        if encoder is None:
+            data = _encode_value(payload)
+            finite = _is_finite_value(data)
+        else:
+            data = encoder(payload)
+            try:
+                finite = _FINITE_CHECKS[cls](payload)
+            except (OverflowError, TypeError):
+                finite = False
+        if finite:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                pass
+        return _stdlib_dumps(data)
+
+    def _loads(line: bytes) -> Any:
+        if _WIDE_INT.search(line) is None:
+            try:
+                return orjson.loads(line)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(line)
+
+else:  # pragma: no cover - exercised without orjson installed
+
+    def _dumps_payload(payload: Any) -> bytes:
+        return _stdlib_dumps(_ENCODERS.get(type(payload), _encode_value)(payload))
+
+    _loads = json.loads
+
+
+_LINE_PREFIXES = {
+    event_type: b'{"event_type":"' + event_type.value.encode("utf-8") + b'","data":' for event_type in EventType
+}
+
+
+_EVENT_TYPES = {member.value: member for member in EventType}
+_VENUES = {member.value: member for member in Venue}
+_SIDES = {member.value: member for member in Side}
+
+
+def _event_type(value: str) -> EventType:
+    member = _EVENT_TYPES.get(value)
+    return member if member is not None else EventType(value)
+
+
+def _venue(value: str) -> Venue:
+    member = _VENUES.get(value)
+    return member if member is not None else Venue(value)
+
+
+def _side(value: str) -> Side:
+    member = _SIDES.get(value)
+    return member if member is not None else Side(value)
+
+
 def _decode_book_levels(raw: list[dict]) -> list[BookLevel]:
     return [BookLevel(price=float(item["price"]), size=float(item["size"])) for item in raw]
 
@@ -59,7 +246,7 @@ def _parse_datetime(value: str) -> datetime:
 def _decode_feature_frame(data: dict) -> FeatureFrame:
     return FeatureFrame(
         symbol=data["symbol"],
-        venue=Venue(data["venue"]),
+        venue=_venue(data["venue"]),
         ts_utc=_parse_datetime(data["ts_utc"]),
         depth_near=float(data["depth_near"]),
         microprice_bias=float(data["microprice_bias"]),
@@ -77,105 +264,131 @@ def _decode_feature_frame(data: dict) -> FeatureFrame:
     )
 
 
+def _decode_book_snapshot(data: dict) -> BookSnapshot:
+    return BookSnapshot(
+        symbol=data["symbol"],
+        venue=_venue(data["venue"]),
+        ts_utc=_parse_datetime(data["ts_utc"]),
+        bids=_decode_book_levels(data.get("bids", [])),
+        asks=_decode_book_levels(data.get("asks", [])),
+        depth=int(data["depth"]),
+    )
+
+
+def _decode_book_delta(data: dict) -> BookDelta:
+    return BookDelta(
+        symbol=data["symbol"],
+        venue=_venue(data["venue"]),
+        ts_utc=_parse_datetime(data["ts_utc"]),
+        bids=_decode_book_levels(data.get("bids", [])),
+        asks=_decode_book_levels(data.get("asks", [])),
+        is_snapshot=bool(data.get("is_snapshot")),
+        update_id=data.get("update_id"),
+    )
+
+
+def _decode_trade(data: dict) -> TradePrint:
+    return TradePrint(
+        symbol=data["symbol"],
+        venue=_venue(data["venue"]),
+        ts_utc=_parse_datetime(data["ts_utc"]),
+        price=float(data["price"]),
+        size=float(data["size"]),
+        aggressor_side=_side(data["aggressor_side"]),
+    )
+
+
+def _decode_quote(data: dict) -> QuoteTick:
+    return QuoteTick(
+        symbol=data["symbol"],
+        venue=_venue(data["venue"]),
+        ts_utc=_parse_datetime(data["ts_utc"]),
+        bid=float(data["bid"]),
+        ask=float(data["ask"]),
+        last=float(data["last"]),
+    )
+
+
+def _decode_signal(data: dict) -> SignalEvent:
+    return SignalEvent(
+        event_name=data["event_name"],
+        symbol=data["symbol"],
+        venue=_venue(data["venue"]),
+        ts_utc=_parse_datetime(data["ts_utc"]),
+        score_0_1=float(data["score_0_1"]),
+        reason_codes=data.get("reason_codes") or [],
+        meta=data.get("meta") or {},
+    )
+
+
+def _decode_trade_intent(data: dict) -> TradeIntent:
+    return TradeIntent(
+        symbol=data["symbol"],
+        direction=_side(data["direction"]),
+        score=float(data["score"]),
+        risk_frac=float(data["risk_frac"]),
+        entry_plan=data.get("entry_plan") or {},
+        stop_plan=data.get("stop_plan") or {},
+        ts_utc=_parse_datetime(data["ts_utc"]),
+        reason_codes=data.get("reason_codes") or [],
+        meta=data.get("meta") or {},
+    )
+
+
+def _decode_data_quality(data: dict) -> DataQualitySnapshot:
+    return DataQualitySnapshot(
+        ts_utc=_parse_datetime(data["ts_utc"]),
+        symbol=data["symbol"],
+        per_venue=data.get("per_venue") or {},
+        queue_depth=int(data.get("queue_depth", 0)),
+        mid_by_venue={key: float(val) for key, val in data.get("mid_by_venue", {}).items()},
+        mid_diff_bps=float(data["mid_diff_bps"]) if data.get("mid_diff_bps") is not None else None,
+        score_0_1=float(data.get("score_0_1", 0.0)),
+        reason_codes=data.get("reason_codes") or [],
+        meta=data.get("meta") or {},
+    )
+
+
+def _decode_engine_state(data: dict) -> EngineStateEvent:
+    return EngineStateEvent(
+        ts_utc=_parse_datetime(data["ts_utc"]),
+        state=str(data.get("state", "")),
+        prev_state=str(data.get("prev_state", "")),
+        score_0_1=float(data.get("score_0_1", 0.0)),
+        reason_codes=data.get("reason_codes") or [],
+        meta=data.get("meta") or {},
+    )
+
+
+def _decode_raw(data: dict) -> dict:
+    return data
+
+
+_DECODERS: dict[EventType, Callable[[dict], Any]] = {
+    EventType.BOOK_SNAPSHOT: _decode_book_snapshot,
+    EventType.BOOK_DELTA: _decode_book_delta,
+    EventType.TRADE: _decode_trade,
+    EventType.QUOTE: _decode_quote,
+    EventType.EVENT_SIGNAL: _decode_signal,
+    EventType.FEATURE: _decode_feature_frame,
+    EventType.TRADE_INTENT: _decode_trade_intent,
+    EventType.DATA_QUALITY: _decode_data_quality,
+    EventType.ENGINE_STATE: _decode_engine_state,
+}
+
+
 def decode_record(record: dict) -> tuple[EventType, Any]:
-    event_type = EventType(record["event_type"])
-    data = record.get("data", {})
-    if event_type == EventType.BOOK_SNAPSHOT:
-        payload = BookSnapshot(
-            symbol=data["symbol"],
-            venue=Venue(data["venue"]),
-            ts_utc=_parse_datetime(data["ts_utc"]),
-            bids=_decode_book_levels(data.get("bids", [])),
-            asks=_decode_book_levels(data.get("asks", [])),
-            depth=int(data["depth"]),
-        )
-    elif event_type == EventType.BOOK_DELTA:
-        payload = BookDelta(
-            symbol=data["symbol"],
-            venue=Venue(data["venue"]),
-            ts_utc=_parse_datetime(data["ts_utc"]),
-            bids=_decode_book_levels(data.get("bids", [])),
-            asks=_decode_book_levels(data.get("asks", [])),
-            is_snapshot=bool(data.get("is_snapshot")),
-            update_id=data.get("update_id"),
-        )
-    elif event_type == EventType.TRADE:
-        payload = TradePrint(
-            symbol=data["symbol"],
-            venue=Venue(data["venue"]),
-            ts_utc=_parse_datetime(data["ts_utc"]),
-            price=float(data["price"]),
-            size=float(data["size"]),
-            aggressor_side=Side(data["aggressor_side"]),
-        )
-    elif event_type == EventType.QUOTE:
-        payload = QuoteTick(
-            symbol=data["symbol"],
-            venue=Venue(data["venue"]),
-            ts_utc=_parse_datetime(data["ts_utc"]),
-            bid=float(data["bid"]),
-            ask=float(data["ask"]),
-            last=float(data["last"]),
-        )
-    elif event_type == EventType.EVENT_SIGNAL:
-        payload = SignalEvent(
-            event_name=data["event_name"],
-            symbol=data["symbol"],
-            venue=Venue(data["venue"]),
-            ts_utc=_parse_datetime(data["ts_utc"]),
-            score_0_1=float(data["score_0_1"]),
-            reason_codes=list(data.get("reason_codes", [])),
-            meta=dict(data.get("meta", {})),
-        )
-    elif event_type == EventType.FEATURE:
-        payload = _decode_feature_frame(data)
-    elif event_type == EventType.TRADE_INTENT:
-        payload = TradeIntent(
-            symbol=data["symbol"],
-            direction=Side(data["direction"]),
-            score=float(data["score"]),
-            risk_frac=float(data["risk_frac"]),
-            entry_plan=dict(data.get("entry_plan", {})),
-            stop_plan=dict(data.get("stop_plan", {})),
-            ts_utc=_parse_datetime(data["ts_utc"]),
-            reason_codes=list(data.get("reason_codes", [])),
-            meta=dict(data.get("meta", {})),
-        )
-    elif event_type == EventType.DATA_QUALITY:
-        payload = DataQualitySnapshot(
-            ts_utc=_parse_datetime(data["ts_utc"]),
-            symbol=data["symbol"],
-            per_venue=dict(data.get("per_venue", {})),
-            queue_depth=int(data.get("queue_depth", 0)),
-            mid_by_venue={key: float(val) for key, val in data.get("mid_by_venue", {}).items()},
-            mid_diff_bps=float(data["mid_diff_bps"]) if data.get("mid_diff_bps") is not None else None,
-            score_0_1=float(data.get("score_0_1", 0.0)),
-            reason_codes=list(data.get("reason_codes", [])),
-            meta=dict(data.get("meta", {})),
-        )
-    elif event_type == EventType.ENGINE_STATE:
-        payload = EngineStateEvent(
-            ts_utc=_parse_datetime(data["ts_utc"]),
-            state=str(data.get("state", "")),
-            prev_state=str(data.get("prev_state", "")),
-            score_0_1=float(data.get("score_0_1", 0.0)),
-            reason_codes=list(data.get("reason_codes", [])),
-            meta=dict(data.get("meta", {})),
-        )
-    else:
-        payload = data
-    return event_type, payload
+    event_type = _event_type(record["event_type"])
+    return event_type, _DECODERS.get(event_type, _decode_raw)(record.get("data", {}))
 
 
 class JournalWriter:
     def __init__(self, path: str) -> None:
         self._path = path
-        self._handle = open(self._path, "a", encoding="utf-8")
+        self._handle = open(self._path, "ab")
 
     def append(self, event_type: EventType, payload: Any) -> None:
-        record = encode_record(event_type, payload)
-        line = json.dumps(record, separators=(",", ":"))
-        self._handle.write(line + "\n")
+        self._handle.write(_LINE_PREFIXES[event_type] + _dumps_payload(payload) + b"}\n")
         self._handle.flush()
 
     def close(self) -> None:
@@ -185,14 +398,36 @@ class JournalWriter:
 
 
 def iter_records(path: str) -> Iterable[dict]:
-    with open(path, "r", encoding="utf-8") as handle:
+    with open(path, "rb") as handle:
         for line in handle:
             line = line.strip()
             if not line:
                 continue
-            yield json.loads(line)
+            yield _loads(line)
+
 
+_EVENT_TYPE_PREFIX = b'{"event_type":"'
 
-def iter_events(path: str) -> Iterable[tuple[EventType, Any]]:
-    for record in iter_records(path):
-        yield decode_record(record)
+
+def iter_events(path: str, event_filter: set[EventType] | None = None) -> Iterable[tuple[EventType, Any]]:
+    if event_filter is None:
+        for record in iter_records(path):
+            yield decode_record(record)
+        return
+
+    wanted = {event_type.value.encode("utf-8") for event_type in event_filter}
+    start = len(_EVENT_TYPE_PREFIX)
+    with open(path, "rb") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith(_EVENT_TYPE_PREFIX):
+                end = line.find(b'"', start)
+                if end > 0:
+                    if line[start:end] in wanted:
+                        yield decode_record(_loads(line))
+                    continue
+            event_type, payload = decode_record(_loads(line))
+            if event_type in event_filter:
+                yield event_type, payload
@@ -13,9 +13,7 @@ class ReplayEngine:
         self._event_filter = event_filter
 
     def run(self, path: str) -> None:
-        for event_type, payload in iter_events(path):
-            if self._event_filter is not None and event_type not in self._event_filter:
-                continue
+        for event_type, payload in iter_events(path, self._event_filter):
             self._bus.publish(event_type, payload)
 
 
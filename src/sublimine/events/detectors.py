@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from collections import deque
 from dataclasses import dataclass
 
@@ -13,16 +14,38 @@ from sublimine.features.feature_engine import FeatureFrame
 class RollingQuantile:
     def __init__(self, window: int) -> None:
         self._values: deque[float] = deque(maxlen=window)
+        self._sorted: list[float] = []
+        self._nans = 0
 
     def update(self, value: float) -> None:
-        self._values.append(value)
+        # NaNs break bisect ordering, so they stay out of _sorted; while one is in
+        # the window quantile() falls back to sorting the raw window.
+        values = self._values
+        ordered = self._sorted
+        if values and len(values) == values.maxlen:
+            oldest = values[0]
+            if oldest != oldest:
+                self._nans -= 1
+            else:
+                idx = bisect_left(ordered, oldest)
+                if idx < len(ordered) and ordered[idx] == oldest:
+                    del ordered[idx]
+                else:
+                    ordered.remove(oldest)
+        values.append(value)
+        if value != value:
+            self._nans += 1
+        else:
+            insort(ordered, value)
 
     def quantile(self, q: float) -> float | None:
-        if not self._values:
+        if self._nans:
+            ordered = sorted(self._values)
+        else:
+            ordered = self._sorted
+        if not ordered:
             return None
-        values = sorted(self._values)
-        idx = int(q * (len(values) - 1))
-        return values[idx]
+        return ordered[int(q * (len(ordered) - 1))]
 
     def ready(self, min_samples: int) -> bool:
         return len(self._values) >= min_samples
@@ -79,17 +102,19 @@ class DetectorEngine:
         if not self._depth.ready(self._config.min_samples):
             return signals
 
-        depth_low = self._depth.quantile(self._config.quantile_low)
-        ofi_high = self._ofi.quantile(self._config.quantile_high)
-        bias_high = self._bias.quantile(self._config.quantile_high)
-        delta_high = self._delta.quantile(self._config.quantile_high)
-        progress_low = self._progress.quantile(self._config.quantile_low)
-        replen_high = self._replen.quantile(self._config.quantile_high)
-        sweep_high = self._sweep.quantile(self._config.quantile_high)
-        return_high = self._return_speed.quantile(self._config.quantile_high)
-        post_abs_high = self._post_abs.quantile(self._config.quantile_high)
-        basis_high = self._basis.quantile(self._config.quantile_high)
-        lead_lag_high = self._lead_lag.quantile(self._config.quantile_high)
+        q_high = self._config.quantile_high
+        q_low = self._config.quantile_low
+        depth_low = self._depth.quantile(q_low)
+        ofi_high = self._ofi.quantile(q_high)
+        bias_high = self._bias.quantile(q_high)
+        delta_high = self._delta.quantile(q_high)
+        progress_low = self._progress.quantile(q_low)
+        replen_high = self._replen.quantile(q_high)
+        sweep_high = self._sweep.quantile(q_high)
+        return_high = self._return_speed.quantile(q_high)
+        post_abs_high = self._post_abs.quantile(q_high)
+        basis_high = self._basis.quantile(q_high)
+        lead_lag_high = self._lead_lag.quantile(q_high)
 
         if depth_low is not None and ofi_high is not None and bias_high is not None:
             if frame.depth_near <= depth_low and frame.ofi_z >= ofi_high and frame.microprice_bias >= bias_high:
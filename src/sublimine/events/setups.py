@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from collections import deque
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from math import sqrt
+from typing import Sequence
 
 from sublimine.config import ThresholdsConfig
 from sublimine.contracts.types import SignalEvent, Venue
@@ -11,6 +11,7 @@ from sublimine.events.microbars import MicroBar
 from sublimine.events.scoring import clamp_score
 
 _EPS = 1e-12
+_NO_SIGNALS: tuple[SignalEvent, ...] = ()
 
 
 def _bar_range(bar: MicroBar) -> float:
@@ -56,19 +57,25 @@ def _bps(value: float, base: float) -> float:
     return value / max(base, _EPS) * 10_000.0
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
 def _ms(ts_utc: datetime) -> int:
     if ts_utc.tzinfo is None:
         ts_utc = ts_utc.replace(tzinfo=timezone.utc)
-    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
-    delta = ts_utc - epoch
+    delta = ts_utc - _EPOCH
     return delta.days * 86_400_000 + delta.seconds * 1_000 + delta.microseconds // 1_000
 
 
+_BUY = "BUY"
+_SELL = "SELL"
+
+
 def _dir_str(direction: int) -> str:
-    return "BUY" if direction > 0 else "SELL"
+    return _BUY if direction > 0 else _SELL
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class DLVState:
     stage: str = "idle"  # idle|pause|await_breakout
     direction: int = 0
@@ -76,38 +83,37 @@ class DLVState:
     pre_range_low: float = 0.0
     run_quality: float = 0.0
     avg_run_range: float = 0.0
-    pause_bars: tuple[MicroBar, ...] = ()
+    pause_bars: list[MicroBar] = field(default_factory=list)
     pause_high: float = 0.0
     pause_low: float = 0.0
     pause_range: float = 0.0
 
 
-@dataclass(frozen=True)
-class SAFEntry:
-    ts_end: datetime
-    reach_bps: float
-    ofi_abs: float
-
-
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class SAFState:
     stage: str = "idle"  # idle|collecting|await_break
     attack_side: int = 0
     level: float = 0.0
-    attacks: tuple[SAFEntry, ...] = ()
+    count: int = 0
+    first_ts_ms: int = 0
+    first_reach_bps: float = 0.0
+    first_ofi_abs: float = 0.0
+    last_ts_ms: int = 0
+    last_reach_bps: float = 0.0
+    last_ofi_abs: float = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class AFSState:
     stage: str = "idle"  # idle|acceptance
     sweep_direction: int = 0
     pre_high: float = 0.0
     pre_low: float = 0.0
     sweep_bar: MicroBar | None = None
-    acceptance_bars: tuple[MicroBar, ...] = ()
+    acceptance_bars: list[MicroBar] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class PERState:
     active: bool = False
     direction: int = 0
@@ -127,7 +133,20 @@ class SetupEngine:
         self._symbol = symbol
         self._venue = venue
         self._t = thresholds
-        self._history: deque[MicroBar] = deque(maxlen=self._max_history(thresholds))
+        dlv_tol = thresholds.dlv_retest_tolerance_bps / 10_000.0
+        self._dlv_up_factor = 1.0 + dlv_tol
+        self._dlv_down_factor = 1.0 - dlv_tol
+        afs_sweep = thresholds.afs_sweep_bps / 10_000.0
+        self._afs_up_factor = 1.0 + afs_sweep
+        self._afs_down_factor = 1.0 - afs_sweep
+        per_hold = thresholds.per_min_hold_bps / 10_000.0
+        self._per_up_factor = 1.0 + per_hold
+        self._per_down_factor = 1.0 - per_hold
+        self._max_len = self._max_history(thresholds)
+        self._history: list[MicroBar] = []
+        self._highs: list[float] = []
+        self._lows: list[float] = []
+        self._directions: list[int] = []
         self._dlv = DLVState()
         self._saf = SAFState()
         self._afs = AFSState()
@@ -135,7 +154,7 @@ class SetupEngine:
 
     def on_primitive_signal(self, signal: SignalEvent) -> None:
         if signal.meta.get("actionable") is True and signal.meta.get("setup") == "DLV":
-            direction = 1 if signal.meta.get("direction") == "BUY" else -1
+            direction = 1 if signal.meta.get("direction") == _BUY else -1
             pre_high = float(signal.meta.get("pre_range_high", 0.0))
             pre_low = float(signal.meta.get("pre_range_low", 0.0))
             peak_high = float(signal.meta.get("peak_high", signal.meta.get("pause_high", pre_high)))
@@ -154,29 +173,31 @@ class SetupEngine:
                 last_bar=None,
             )
 
-    def on_bar(self, bar: MicroBar) -> list[SignalEvent]:
-        self._history.append(bar)
-
-        signals: list[SignalEvent] = []
+    def on_bar(self, bar: MicroBar) -> Sequence[SignalEvent]:
+        history = self._history
+        highs = self._highs
+        lows = self._lows
+        directions = self._directions
+        history.append(bar)
+        highs.append(bar.high)
+        lows.append(bar.low)
+        directions.append(_bar_direction(bar))
+        if len(history) > 2 * self._max_len:
+            del history[: -self._max_len]
+            del highs[: -self._max_len]
+            del lows[: -self._max_len]
+            del directions[: -self._max_len]
 
         per_signal = self._update_per(bar)
-        if per_signal is not None:
-            signals.append(per_signal)
-
         dlv_signal = self._update_dlv(bar)
         if dlv_signal is not None:
-            signals.append(dlv_signal)
             self.on_primitive_signal(dlv_signal)
-
         saf_signal = self._update_saf(bar)
-        if saf_signal is not None:
-            signals.append(saf_signal)
-
         afs_signal = self._update_afs(bar)
-        if afs_signal is not None:
-            signals.append(afs_signal)
 
-        return signals
+        if per_signal is None and dlv_signal is None and saf_signal is None and afs_signal is None:
+            return _NO_SIGNALS
+        return [signal for signal in (per_signal, dlv_signal, saf_signal, afs_signal) if signal is not None]
 
     @staticmethod
     def _max_history(t: ThresholdsConfig) -> int:
@@ -196,42 +217,43 @@ class SetupEngine:
             if len(self._history) < needed:
                 return None
 
-            hist = list(self._history)
-            run = hist[-t.dlv_run_bars :]
-            pre = hist[-(t.dlv_pre_bars + t.dlv_run_bars) : -t.dlv_run_bars]
-            pre_high = max(b.high for b in pre)
-            pre_low = min(b.low for b in pre)
-            direction = _bar_direction(run[0])
-            if direction == 0 or any(_bar_direction(b) != direction for b in run):
+            run_directions = self._directions[-t.dlv_run_bars :]
+            direction = run_directions[0]
+            if direction == 0 or run_directions.count(direction) != len(run_directions):
                 return None
-
-            tol = t.dlv_retest_tolerance_bps / 10_000.0
-            if direction > 0:
-                min_allowed = pre_high * (1.0 + tol)
-                if any(b.low <= min_allowed for b in run):
-                    return None
-            else:
-                max_allowed = pre_low * (1.0 - tol)
-                if any(b.high >= max_allowed for b in run):
+            run = self._history[-t.dlv_run_bars :]
+
+            pre_high = max(self._highs[-needed : -t.dlv_run_bars])
+            pre_low = min(self._lows[-needed : -t.dlv_run_bars])
+            min_allowed = pre_high * self._dlv_up_factor
+            max_allowed = pre_low * self._dlv_down_factor
+
+            quality_sum = 0.0
+            range_sum = 0.0
+            prev: MicroBar | None = None
+            for b in run:
+                if direction > 0:
+                    if b.low <= min_allowed:
+                        return None
+                elif b.high >= max_allowed:
                     return None
-
-            quality_terms: list[float] = []
-            for idx, b in enumerate(run):
                 overlap = 0.0
-                if idx > 0:
-                    overlap = _overlap_ratio(run[idx - 1], b)
+                if prev is not None:
+                    overlap = _overlap_ratio(prev, b)
                     if overlap > t.dlv_max_overlap_ratio:
                         return None
                 counter = _counter_wick_ratio(b, direction)
-                close_off = _close_off_ratio(b, direction)
                 if counter > t.dlv_max_counter_wick_ratio:
                     return None
+                close_off = _close_off_ratio(b, direction)
                 if close_off > t.dlv_max_close_off_ratio:
                     return None
-                quality_terms.append((1.0 - overlap) * (1.0 - counter) * (1.0 - close_off))
+                quality_sum += (1.0 - overlap) * (1.0 - counter) * (1.0 - close_off)
+                range_sum += _bar_range(b)
+                prev = b
 
-            avg_run_range = sum(_bar_range(b) for b in run) / len(run)
-            run_quality = sum(quality_terms) / len(quality_terms)
+            avg_run_range = range_sum / len(run)
+            run_quality = quality_sum / len(run)
 
             self._dlv = DLVState(
                 stage="pause",
@@ -240,25 +262,25 @@ class SetupEngine:
                 pre_range_low=pre_low,
                 run_quality=run_quality,
                 avg_run_range=avg_run_range,
-                pause_bars=(),
+                pause_bars=[],
                 pause_high=0.0,
                 pause_low=0.0,
                 pause_range=0.0,
             )
             return None
 
-        tol = t.dlv_retest_tolerance_bps / 10_000.0
         if self._dlv.direction > 0:
-            if bar.low <= self._dlv.pre_range_high * (1.0 + tol):
+            if bar.low <= self._dlv.pre_range_high * self._dlv_up_factor:
                 self._dlv = DLVState()
                 return None
         else:
-            if bar.high >= self._dlv.pre_range_low * (1.0 - tol):
+            if bar.high >= self._dlv.pre_range_low * self._dlv_down_factor:
                 self._dlv = DLVState()
                 return None
 
         if self._dlv.stage == "pause":
-            pause = self._dlv.pause_bars + (bar,)
+            pause = self._dlv.pause_bars
+            pause.append(bar)
             pause_high = max(b.high for b in pause)
             pause_low = min(b.low for b in pause)
             pause_range = pause_high - pause_low
@@ -266,16 +288,12 @@ class SetupEngine:
                 self._dlv = DLVState()
                 return None
             if len(pause) < t.dlv_pause_bars:
-                self._dlv = replace(self._dlv, pause_bars=pause)
                 return None
-            self._dlv = replace(
-                self._dlv,
-                stage="await_breakout",
-                pause_bars=pause,
-                pause_high=pause_high,
-                pause_low=pause_low,
-                pause_range=pause_range,
-            )
+            dlv = self._dlv
+            dlv.stage = "await_breakout"
+            dlv.pause_high = pause_high
+            dlv.pause_low = pause_low
+            dlv.pause_range = pause_range
             return None
 
         if self._dlv.stage != "await_breakout":
@@ -320,10 +338,10 @@ class SetupEngine:
 
         if len(self._history) < 2:
             return None
-        prev = list(self._history)[-2]
+        prev = self._history[-2]
 
         if self._saf.stage == "await_break":
-            if self._saf.attacks and _ms(bar.ts_end) - _ms(self._saf.attacks[-1].ts_end) > t.saf_window_ms:
+            if self._saf.count and _ms(bar.ts_end) - self._saf.last_ts_ms > t.saf_window_ms:
                 self._saf = SAFState()
                 return None
             if self._saf.attack_side > 0 and bar.close < prev.low:
@@ -343,68 +361,71 @@ class SetupEngine:
         if not is_attack:
             if (
                 self._saf.stage == "collecting"
-                and self._saf.attacks
-                and _ms(bar.ts_end) - _ms(self._saf.attacks[0].ts_end) > t.saf_window_ms
+                and self._saf.count
+                and _ms(bar.ts_end) - self._saf.first_ts_ms > t.saf_window_ms
             ):
                 self._saf = SAFState()
             return None
 
         if len(self._history) < t.saf_level_bars + 1:
             return None
-        hist = list(self._history)
-        level_bars = hist[-t.saf_level_bars - 1 : -1]
         if attack_side > 0:
-            level = max(b.high for b in level_bars)
+            level = max(self._highs[-t.saf_level_bars - 1 : -1])
             reach = max(0.0, _bps(level - bar.high, level))
         else:
-            level = min(b.low for b in level_bars)
+            level = min(self._lows[-t.saf_level_bars - 1 : -1])
             reach = max(0.0, _bps(bar.low - level, level))
 
-        entry = SAFEntry(ts_end=bar.ts_end, reach_bps=reach, ofi_abs=bar.ofi_abs_mean)
-
-        if self._saf.stage == "idle":
-            self._saf = SAFState(stage="collecting", attack_side=attack_side, level=level, attacks=(entry,))
-            return None
-
-        if self._saf.attack_side != attack_side:
-            self._saf = SAFState(stage="collecting", attack_side=attack_side, level=level, attacks=(entry,))
-            return None
-
-        if self._saf.attacks and _ms(bar.ts_end) - _ms(self._saf.attacks[0].ts_end) > t.saf_window_ms:
-            self._saf = SAFState(stage="collecting", attack_side=attack_side, level=level, attacks=(entry,))
-            return None
-
-        level_diff_bps = _bps(abs(level - self._saf.level), self._saf.level)
-        if level_diff_bps > t.saf_level_tolerance_bps:
-            self._saf = SAFState(stage="collecting", attack_side=attack_side, level=level, attacks=(entry,))
+        bar_ms = _ms(bar.ts_end)
+        saf = self._saf
+        if (
+            saf.stage == "idle"
+            or saf.attack_side != attack_side
+            or (saf.count and bar_ms - saf.first_ts_ms > t.saf_window_ms)
+            or _bps(abs(level - saf.level), saf.level) > t.saf_level_tolerance_bps
+        ):
+            self._saf = SAFState(
+                stage="collecting",
+                attack_side=attack_side,
+                level=level,
+                count=1,
+                first_ts_ms=bar_ms,
+                first_reach_bps=reach,
+                first_ofi_abs=bar.ofi_abs_mean,
+                last_ts_ms=bar_ms,
+                last_reach_bps=reach,
+                last_ofi_abs=bar.ofi_abs_mean,
+            )
             return None
 
-        attacks = self._saf.attacks + (entry,)
-        self._saf = replace(self._saf, attacks=attacks)
+        saf.count += 1
+        saf.last_ts_ms = bar_ms
+        saf.last_reach_bps = reach
+        saf.last_ofi_abs = bar.ofi_abs_mean
 
-        if len(attacks) < t.saf_min_attacks:
+        if saf.count < t.saf_min_attacks:
             return None
 
-        reach_worsen = attacks[-1].reach_bps - attacks[0].reach_bps
+        reach_worsen = saf.last_reach_bps - saf.first_reach_bps
         if reach_worsen < t.saf_reach_worsen_bps:
             return None
-        if attacks[-1].ofi_abs > attacks[0].ofi_abs * t.saf_ofi_decay_ratio:
+        if saf.last_ofi_abs > saf.first_ofi_abs * t.saf_ofi_decay_ratio:
             return None
 
-        self._saf = replace(self._saf, stage="await_break")
+        saf.stage = "await_break"
         return None
 
     def _emit_saf(self, bar: MicroBar, prev: MicroBar) -> SignalEvent:
         t = self._t
-        attacks = self._saf.attacks
-        reach_worsen = attacks[-1].reach_bps - attacks[0].reach_bps if attacks else 0.0
+        saf = self._saf
+        reach_worsen = saf.last_reach_bps - saf.first_reach_bps if saf.count else 0.0
         reach_quality = 1.0 if t.saf_reach_worsen_bps <= 0 else clamp_score(reach_worsen / t.saf_reach_worsen_bps)
-        target_ofi = (attacks[0].ofi_abs * t.saf_ofi_decay_ratio) if attacks else 0.0
-        last_ofi = attacks[-1].ofi_abs if attacks else 0.0
+        target_ofi = (saf.first_ofi_abs * t.saf_ofi_decay_ratio) if saf.count else 0.0
+        last_ofi = saf.last_ofi_abs if saf.count else 0.0
         ofi_quality = 1.0 if target_ofi <= 0 else clamp_score(target_ofi / max(last_ofi, _EPS))
         score = clamp_score(sqrt(reach_quality * ofi_quality))
 
-        reversal = -self._saf.attack_side
+        reversal = -saf.attack_side
         signal = SignalEvent(
             event_name="E2",
             symbol=self._symbol,
@@ -416,8 +437,8 @@ class SetupEngine:
                 "actionable": True,
                 "setup": "SAF",
                 "direction": _dir_str(reversal),
-                "level": self._saf.level,
-                "reach_bps": attacks[-1].reach_bps if attacks else 0.0,
+                "level": saf.level,
+                "reach_bps": saf.last_reach_bps if saf.count else 0.0,
                 "prev_high": prev.high,
                 "prev_low": prev.low,
             },
@@ -431,12 +452,10 @@ class SetupEngine:
         if self._afs.stage == "idle":
             if len(self._history) < t.afs_pre_bars + 1:
                 return None
-            hist = list(self._history)
-            pre = hist[-t.afs_pre_bars - 1 : -1]
-            pre_high = max(b.high for b in pre)
-            pre_low = min(b.low for b in pre)
-            up_sweep = bar.high >= pre_high * (1.0 + t.afs_sweep_bps / 10_000.0)
-            down_sweep = bar.low <= pre_low * (1.0 - t.afs_sweep_bps / 10_000.0)
+            pre_high = max(self._highs[-t.afs_pre_bars - 1 : -1])
+            pre_low = min(self._lows[-t.afs_pre_bars - 1 : -1])
+            up_sweep = bar.high >= pre_high * self._afs_up_factor
+            down_sweep = bar.low <= pre_low * self._afs_down_factor
             if not up_sweep and not down_sweep:
                 return None
             if up_sweep and down_sweep:
@@ -452,7 +471,7 @@ class SetupEngine:
                 pre_high=pre_high,
                 pre_low=pre_low,
                 sweep_bar=bar,
-                acceptance_bars=(),
+                acceptance_bars=[],
             )
             return None
 
@@ -467,7 +486,7 @@ class SetupEngine:
             return None
 
         if accept_cond:
-            self._afs = replace(self._afs, acceptance_bars=self._afs.acceptance_bars + (bar,))
+            self._afs.acceptance_bars.append(bar)
             return None
 
         if not self._afs.acceptance_bars:
@@ -493,10 +512,10 @@ class SetupEngine:
 
         if self._afs.sweep_direction > 0:
             is_fail = bar.close <= self._afs.pre_high and bar.close < acc_low
-            direction = "SELL"
+            direction = _SELL
         else:
             is_fail = bar.close >= self._afs.pre_low and bar.close > acc_high
-            direction = "BUY"
+            direction = _BUY
 
         if not is_fail:
             self._afs = AFSState()
@@ -565,7 +584,7 @@ class SetupEngine:
                 pullback_seen = True
 
         if self._per.direction > 0:
-            hold_level = self._per.old_range_high * (1.0 + t.per_min_hold_bps / 10_000.0)
+            hold_level = self._per.old_range_high * self._per_up_factor
             if pullback_low is not None and pullback_low <= hold_level:
                 self._per = PERState()
                 return None
@@ -574,7 +593,7 @@ class SetupEngine:
                 self._per = PERState()
                 return None
         else:
-            hold_level = self._per.old_range_low * (1.0 - t.per_min_hold_bps / 10_000.0)
+            hold_level = self._per.old_range_low * self._per_down_factor
             if pullback_high is not None and pullback_high >= hold_level:
                 self._per = PERState()
                 return None
@@ -591,16 +610,14 @@ class SetupEngine:
             if self._per.direction < 0 and bar.close < prev.low:
                 signal = self._emit_per(bar, peak_low, pullback_high, depth_bps)
 
-        self._per = replace(
-            self._per,
-            bars_since=bars_since,
-            peak_high=peak_high,
-            peak_low=peak_low,
-            pullback_low=pullback_low,
-            pullback_high=pullback_high,
-            pullback_seen=pullback_seen,
-            last_bar=bar,
-        )
+        per = self._per
+        per.bars_since = bars_since
+        per.peak_high = peak_high
+        per.peak_low = peak_low
+        per.pullback_low = pullback_low
+        per.pullback_high = pullback_high
+        per.pullback_seen = pullback_seen
+        per.last_bar = bar
         return signal
 
     def _emit_per(
@@ -3,11 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 
-from sublimine.contracts.types import Side, Venue
+from sublimine.contracts.types import BookLevel, Side, Venue
 from sublimine.feeds.book import OrderBook
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BookFeatureSet:
     symbol: str
     venue: Venue
@@ -22,9 +22,17 @@ class BookFeatureSet:
     convexity: float
 
 
-def compute_book_features(book: OrderBook, depth_k: int, ts_utc: datetime) -> BookFeatureSet | None:
-    best_bid = book.best_bid()
-    best_ask = book.best_ask()
+def compute_book_features(
+    book: OrderBook,
+    depth_k: int,
+    ts_utc: datetime,
+    best_bid: BookLevel | None = None,
+    best_ask: BookLevel | None = None,
+) -> BookFeatureSet | None:
+    if best_bid is None:
+        best_bid = book.best_bid()
+    if best_ask is None:
+        best_ask = book.best_ask()
     if best_bid is None or best_ask is None:
         return None
 
@@ -33,19 +41,20 @@ def compute_book_features(book: OrderBook, depth_k: int, ts_utc: datetime) -> Bo
     microprice = _microprice(best_bid.price, best_bid.size, best_ask.price, best_ask.size)
     microprice_bias = (microprice - mid) / spread if spread > 0 else 0.0
 
-    bids = book.top_n(Side.BUY, depth_k)
-    asks = book.top_n(Side.SELL, depth_k)
+    bid_prices, bid_sizes = book.top_n_columns(Side.BUY, depth_k)
+    ask_prices, ask_sizes = book.top_n_columns(Side.SELL, depth_k)
 
-    bid_depth = sum(level.size for level in bids)
-    ask_depth = sum(level.size for level in asks)
+    bid_depth = sum(bid_sizes)
+    ask_depth = sum(ask_sizes)
     depth_near = bid_depth + ask_depth
 
     imbalance = 0.0
-    if bid_depth + ask_depth > 0:
-        imbalance = (bid_depth - ask_depth) / (bid_depth + ask_depth)
+    if depth_near > 0:
+        imbalance = (bid_depth - ask_depth) / depth_near
 
-    slope = _liquidity_slope(mid, bids, asks)
-    convexity = _liquidity_convexity(bids, asks)
+    total_size = sum(ask_sizes, bid_depth)
+    slope = _liquidity_slope(mid, bid_prices, bid_sizes, ask_prices, ask_sizes, total_size)
+    convexity = _liquidity_convexity(bid_sizes, ask_sizes, total_size)
 
     return BookFeatureSet(
         symbol=book.symbol,
@@ -69,23 +78,34 @@ def _microprice(bid_px: float, bid_sz: float, ask_px: float, ask_sz: float) -> f
     return (bid_px * ask_sz + ask_px * bid_sz) / denom
 
 
-def _liquidity_slope(mid: float, bids: list, asks: list) -> float:
-    weighted_dist = 0.0
-    total_size = 0.0
-    for level in bids + asks:
-        dist = abs(level.price - mid)
-        weighted_dist += dist * level.size
-        total_size += level.size
+def _liquidity_slope(
+    mid: float,
+    bid_prices: list[float],
+    bid_sizes: list[float],
+    ask_prices: list[float],
+    ask_sizes: list[float],
+    total_size: float,
+) -> float:
     if total_size == 0:
         return 0.0
+    weighted_dist = 0.0
+    for price, size in zip(bid_prices, bid_sizes):
+        weighted_dist += abs(price - mid) * size
+    for price, size in zip(ask_prices, ask_sizes):
+        weighted_dist += abs(price - mid) * size
     avg_dist = weighted_dist / total_size
     return 1.0 / (avg_dist + 1e-9)
 
 
-def _liquidity_convexity(bids: list, asks: list) -> float:
-    sizes = [level.size for level in bids + asks]
-    if not sizes:
+def _liquidity_convexity(bid_sizes: list[float], ask_sizes: list[float], total_size: float) -> float:
+    n_bids = len(bid_sizes)
+    count = n_bids + len(ask_sizes)
+    if not count:
         return 0.0
-    total = sum(sizes)
-    top = sizes[0] + sizes[len(sizes) // 2] if len(sizes) > 1 else sizes[0]
-    return top / total if total > 0 else 0.0
+    first = bid_sizes[0] if n_bids else ask_sizes[0]
+    if count > 1:
+        middle = count // 2
+        top = first + (bid_sizes[middle] if middle < n_bids else ask_sizes[middle - n_bids])
+    else:
+        top = first
+    return top / total_size if total_size > 0 else 0.0
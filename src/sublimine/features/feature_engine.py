@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+import sys
 
 from sublimine.contracts.types import BookDelta, BookSnapshot, TradePrint, Venue
 from sublimine.feeds.book import OrderBook
@@ -13,7 +14,7 @@ from sublimine.features.spoof import SpoofTracker
 from sublimine.features.vpin import VPINTracker
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FeatureFrame:
     symbol: str
     venue: Venue
@@ -40,6 +41,7 @@ class FeatureEngine:
     window: int
 
     def __post_init__(self) -> None:
+        self.symbol = sys.intern(self.symbol)
         self._book = OrderBook.empty(self.symbol, venue=Venue.BYBIT, depth=self.depth_k)
         self._ofi = OFIState(window=self.window)
         self._iceberg = IcebergTracker(window=self.window)
@@ -56,9 +58,8 @@ class FeatureEngine:
     def on_book_delta(self, delta: BookDelta) -> FeatureFrame | None:
         prev_mid = self._last_mid
         prev_ts = self._last_ts
-        delta_size = sum(abs(level.size) for level in delta.bids + delta.asks)
-        self._spoof.update(delta)
-        self._book.apply_delta(delta)
+        delta_size, removed = self._book.apply_delta(delta)
+        self._spoof.update_counts(removed, len(delta.bids) + len(delta.asks))
         return self._compute_features(delta.ts_utc, (prev_mid, prev_ts, delta_size))
 
     def on_trade(self, trade: TradePrint) -> float:
@@ -69,12 +70,12 @@ class FeatureEngine:
         ts_utc: datetime,
         delta_context: tuple[float | None, datetime | None, float] | None,
     ) -> FeatureFrame | None:
-        features = compute_book_features(self._book, self.depth_k, ts_utc)
+        best_bid = self._book.best_bid()
+        best_ask = self._book.best_ask()
+        features = compute_book_features(self._book, self.depth_k, ts_utc, best_bid, best_ask)
         if features is None:
             return None
 
-        best_bid = self._book.best_bid()
-        best_ask = self._book.best_ask()
         _, ofi_z = self._ofi.update(best_bid, best_ask)
         replenishment = self._iceberg.update(best_bid, best_ask)
 
@@ -90,7 +91,7 @@ class FeatureEngine:
         if prev_mid is not None:
             price_progress = abs(features.mid - prev_mid)
             sweep_distance = price_progress
-            if prev_ts is not None:
+            if prev_ts is not None and price_progress != 0:
                 dt = max((ts_utc - prev_ts).total_seconds(), 1e-6)
                 return_speed = price_progress / dt
 
@@ -14,12 +14,15 @@ class SpoofTracker:
         self._scores: deque[float] = deque(maxlen=self.window)
 
     def update(self, delta: BookDelta) -> float:
-        levels = list(delta.bids) + list(delta.asks)
-        if not levels:
+        bids = delta.bids
+        asks = delta.asks
+        removed = sum(1 for level in bids if level.size == 0) + sum(1 for level in asks if level.size == 0)
+        return self.update_counts(removed, len(bids) + len(asks))
+
+    def update_counts(self, removed: int, count: int) -> float:
+        if not count:
             return self.value
-        removed = sum(1 for level in levels if level.size == 0)
-        score = removed / len(levels)
-        self._scores.append(score)
+        self._scores.append(removed / count)
         return self.value
 
     @property
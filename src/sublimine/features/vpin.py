@@ -6,6 +6,10 @@ from dataclasses import dataclass
 from sublimine.contracts.types import Side, TradePrint
 
 
+_BUY = Side.BUY
+_SELL = Side.SELL
+
+
 @dataclass
 class VPINTracker:
     bucket_size: float
@@ -17,21 +21,26 @@ class VPINTracker:
         self._buckets: deque[float] = deque(maxlen=self.window)
 
     def update(self, trade: TradePrint) -> float:
-        if trade.aggressor_side == Side.BUY:
-            self._bucket_buy += trade.size
-        elif trade.aggressor_side == Side.SELL:
-            self._bucket_sell += trade.size
-
-        total = self._bucket_buy + self._bucket_sell
-        while total >= self.bucket_size and self.bucket_size > 0:
-            buy = min(self._bucket_buy, self.bucket_size)
-            sell = min(self._bucket_sell, self.bucket_size - buy)
-            imbalance = abs(buy - sell) / self.bucket_size
-            self._buckets.append(imbalance)
-            self._bucket_buy = max(0.0, self._bucket_buy - buy)
-            self._bucket_sell = max(0.0, self._bucket_sell - sell)
-            total = self._bucket_buy + self._bucket_sell
-
+        side = trade.aggressor_side
+        bucket_buy = self._bucket_buy
+        bucket_sell = self._bucket_sell
+        if side == _BUY:
+            bucket_buy += trade.size
+        elif side == _SELL:
+            bucket_sell += trade.size
+
+        bucket_size = self.bucket_size
+        if bucket_size > 0:
+            buckets = self._buckets
+            while bucket_buy + bucket_sell >= bucket_size:
+                buy = min(bucket_buy, bucket_size)
+                sell = min(bucket_sell, bucket_size - buy)
+                buckets.append(abs(buy - sell) / bucket_size)
+                bucket_buy = max(0.0, bucket_buy - buy)
+                bucket_sell = max(0.0, bucket_sell - sell)
+
+        self._bucket_buy = bucket_buy
+        self._bucket_sell = bucket_sell
         return self.value
 
     @property
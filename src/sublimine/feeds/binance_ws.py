@@ -3,13 +3,21 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from collections import deque
 from datetime import datetime, timezone
+from functools import lru_cache
 import json
+from operator import attrgetter
+import sys
 import threading
 import time
 from typing import Any, Callable
 import urllib.parse
 import urllib.request
 
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - exercised without orjson installed
+    orjson = None
+
 try:
     import websocket  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover - exercised in live environments
@@ -20,18 +28,23 @@ from sublimine.feeds.book import OrderBook
 from sublimine.feeds.ws_common import ReconnectPolicy
 
 
+_loads = orjson.loads if orjson is not None else json.loads
+
+
 def _parse_levels(raw_levels: list[list[Any]]) -> list[BookLevel]:
-    levels: list[BookLevel] = []
-    for price, size in raw_levels:
-        levels.append(BookLevel(price=float(price), size=float(size)))
-    return levels
+    return [BookLevel(float(price), float(size)) for price, size in raw_levels]
+
+
+_FINAL_UPDATE_ID = attrgetter("final_update_id")
+_EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
 
 
+@lru_cache(maxsize=4096)
 def _ts_from_ms(ms: int) -> datetime:
     return datetime.fromtimestamp(ms / 1000.0, tz=timezone.utc)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BinanceDiffEvent:
     symbol: str
     first_update_id: int
@@ -47,6 +60,7 @@ def parse_binance_diff_event(msg: dict) -> BinanceDiffEvent | None:
     symbol = msg.get("s")
     if symbol is None:
         return None
+    symbol = sys.intern(symbol)
 
     first_id = msg.get("U")
     final_id = msg.get("u")
@@ -56,7 +70,7 @@ def parse_binance_diff_event(msg: dict) -> BinanceDiffEvent | None:
     bids = _parse_levels(msg.get("b", []))
     asks = _parse_levels(msg.get("a", []))
     ts_ms = msg.get("E")
-    ts_utc = _ts_from_ms(int(ts_ms)) if ts_ms is not None else datetime.fromtimestamp(0, tz=timezone.utc)
+    ts_utc = _ts_from_ms(int(ts_ms)) if ts_ms is not None else _EPOCH
 
     delta = BookDelta(
         symbol=symbol,
@@ -83,6 +97,7 @@ def parse_binance_trade_message(msg: dict) -> TradePrint | None:
     symbol = msg.get("s")
     if symbol is None:
         return None
+    symbol = sys.intern(symbol)
     price_raw = msg.get("p")
     size_raw = msg.get("q")
     ts_ms = msg.get("T") or msg.get("E")
@@ -110,7 +125,7 @@ def fetch_binance_snapshot(
     joiner = "&" if "?" in rest_url else "?"
     url = f"{rest_url}{joiner}{params}"
     with urllib.request.urlopen(url, timeout=timeout_s) as response:
-        payload = json.loads(response.read().decode("utf-8"))
+        payload = _loads(response.read())
     last_update_id = int(payload["lastUpdateId"])
     bids = _parse_levels(payload.get("bids", []))
     asks = _parse_levels(payload.get("asks", []))
@@ -132,6 +147,7 @@ class BinanceBookSynchronizer:
         self._book = OrderBook.empty(symbol, Venue.BINANCE, depth)
         self._last_update_id: int | None = None
         self._buffer: list[BinanceDiffEvent] = []
+        self._buffer_ordered = True
         self._synced = False
         self.desynced = False
 
@@ -149,8 +165,11 @@ class BinanceBookSynchronizer:
         self._synced = False
         applied: list[BookDelta] = []
         if self._buffer:
-            buffered = sorted(self._buffer, key=lambda item: item.final_update_id)
-            self._buffer.clear()
+            buffered = self._buffer
+            if not self._buffer_ordered:
+                buffered.sort(key=_FINAL_UPDATE_ID)
+            self._buffer = []
+            self._buffer_ordered = True
             for event in buffered:
                 if self.desynced:
                     break
@@ -160,7 +179,10 @@ class BinanceBookSynchronizer:
 
     def on_diff_event(self, event: BinanceDiffEvent) -> bool:
         if self._last_update_id is None:
-            self._buffer.append(event)
+            buffer = self._buffer
+            if buffer and event.final_update_id < buffer[-1].final_update_id:
+                self._buffer_ordered = False
+            buffer.append(event)
             return False
 
         if event.final_update_id < self._last_update_id:
@@ -184,6 +206,7 @@ class BinanceBookSynchronizer:
 
     def reset_for_resync(self) -> None:
         self._buffer.clear()
+        self._buffer_ordered = True
         self._last_update_id = None
         self._synced = False
         self.desynced = False
@@ -282,7 +305,7 @@ class BinanceConnector:
         if self._sink is None:
             return
         try:
-            payload = json.loads(message)
+            payload = _loads(message)
         except json.JSONDecodeError:
             return
         data = payload.get("data", payload)
@@ -1,32 +1,72 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Iterable
+from bisect import bisect_left, insort
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping
 
 from sublimine.contracts.types import BookDelta, BookLevel, BookSnapshot, Side, Venue
 
 
-@dataclass
+_BUY = Side.BUY
+
+
 class OrderBook:
-    symbol: str
-    venue: Venue
-    depth: int
-    bids: Dict[float, float]
-    asks: Dict[float, float]
+    def __init__(
+        self,
+        symbol: str,
+        venue: Venue,
+        depth: int,
+        bids: Mapping[float, float] | None = None,
+        asks: Mapping[float, float] | None = None,
+    ) -> None:
+        self.symbol = symbol
+        self.venue = venue
+        self.depth = depth
+        self._bids: Dict[float, float] = dict(bids or {})
+        self._asks: Dict[float, float] = dict(asks or {})
+        self._bid_prices = sorted(self._bids)
+        self._ask_prices = sorted(self._asks)
+
+    def __repr__(self) -> str:
+        return (
+            f"OrderBook(symbol={self.symbol!r}, venue={self.venue!r}, depth={self.depth!r}, "
+            f"bids={self._bids!r}, asks={self._asks!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, OrderBook):
+            return NotImplemented
+        return (self.symbol, self.venue, self.depth, self._bids, self._asks) == (
+            other.symbol,
+            other.venue,
+            other.depth,
+            other._bids,
+            other._asks,
+        )
 
     @classmethod
     def empty(cls, symbol: str, venue: Venue, depth: int) -> "OrderBook":
-        return cls(symbol=symbol, venue=venue, depth=depth, bids={}, asks={})
+        return cls(symbol=symbol, venue=venue, depth=depth)
+
+    @property
+    def bids(self) -> Mapping[float, float]:
+        return MappingProxyType(self._bids)
+
+    @property
+    def asks(self) -> Mapping[float, float]:
+        return MappingProxyType(self._asks)
 
     def apply_snapshot(self, snapshot: BookSnapshot) -> None:
         self.symbol = snapshot.symbol
         self.venue = snapshot.venue
         self.depth = snapshot.depth
-        self.bids = {level.price: level.size for level in snapshot.bids}
-        self.asks = {level.price: level.size for level in snapshot.asks}
+        self._bids = {level.price: level.size for level in snapshot.bids}
+        self._asks = {level.price: level.size for level in snapshot.asks}
+        self._bid_prices = sorted(self._bids)
+        self._ask_prices = sorted(self._asks)
         self._trim()
 
-    def apply_delta(self, delta: BookDelta) -> None:
+    def apply_delta(self, delta: BookDelta) -> tuple[float, int]:
         self.symbol = delta.symbol
         self.venue = delta.venue
         if delta.is_snapshot:
@@ -39,47 +79,96 @@ class OrderBook:
                 depth=self.depth,
             )
             self.apply_snapshot(snapshot)
+            size_sum, removed = _level_totals(delta.bids, 0, 0)
+            size_sum, removed = _level_totals(delta.asks, size_sum, removed)
         else:
-            self._apply_levels(self.bids, delta.bids)
-            self._apply_levels(self.asks, delta.asks)
+            size_sum, removed = _apply_levels(self._bids, self._bid_prices, delta.bids, 0, 0)
+            size_sum, removed = _apply_levels(self._asks, self._ask_prices, delta.asks, size_sum, removed)
         self._trim()
+        return size_sum, removed
 
     def _trim(self) -> None:
-        if self.depth <= 0:
-            self.bids = {}
-            self.asks = {}
+        depth = self.depth
+        if depth <= 0:
+            self._bids = {}
+            self._asks = {}
+            self._bid_prices = []
+            self._ask_prices = []
             return
-        if len(self.bids) > self.depth:
-            prices = sorted(self.bids.keys(), reverse=True)[: self.depth]
-            self.bids = {price: self.bids[price] for price in prices}
-        if len(self.asks) > self.depth:
-            prices = sorted(self.asks.keys())[: self.depth]
-            self.asks = {price: self.asks[price] for price in prices}
-
-    def _apply_levels(self, book: Dict[float, float], levels: Iterable[BookLevel]) -> None:
-        for level in levels:
-            if level.size == 0:
-                book.pop(level.price, None)
-            else:
-                book[level.price] = level.size
+        bid_prices = self._bid_prices
+        excess = len(bid_prices) - depth
+        if excess > 0:
+            bids = self._bids
+            for price in bid_prices[:excess]:
+                del bids[price]
+            del bid_prices[:excess]
+        ask_prices = self._ask_prices
+        if len(ask_prices) > depth:
+            asks = self._asks
+            for price in ask_prices[depth:]:
+                del asks[price]
+            del ask_prices[depth:]
 
     def top_n(self, side: Side, n: int) -> list[BookLevel]:
-        if side == Side.BUY:
-            prices = sorted(self.bids.keys(), reverse=True)
-            levels = [BookLevel(price=p, size=self.bids[p]) for p in prices[:n]]
+        if side == _BUY:
+            book = self._bids
+            prices = self._bid_prices[: -n - 1 : -1]
         else:
-            prices = sorted(self.asks.keys())
-            levels = [BookLevel(price=p, size=self.asks[p]) for p in prices[:n]]
-        return levels
+            book = self._asks
+            prices = self._ask_prices[:n]
+        return [BookLevel(price=p, size=book[p]) for p in prices]
+
+    def top_n_columns(self, side: Side, n: int) -> tuple[list[float], list[float]]:
+        if side == _BUY:
+            book = self._bids
+            prices = self._bid_prices[: -n - 1 : -1]
+        else:
+            book = self._asks
+            prices = self._ask_prices[:n]
+        return prices, [book[p] for p in prices]
 
     def best_bid(self) -> BookLevel | None:
-        if not self.bids:
+        prices = self._bid_prices
+        if not prices:
             return None
-        price = max(self.bids.keys())
-        return BookLevel(price=price, size=self.bids[price])
+        price = prices[-1]
+        return BookLevel(price=price, size=self._bids[price])
 
     def best_ask(self) -> BookLevel | None:
-        if not self.asks:
+        prices = self._ask_prices
+        if not prices:
             return None
-        price = min(self.asks.keys())
-        return BookLevel(price=price, size=self.asks[price])
+        price = prices[0]
+        return BookLevel(price=price, size=self._asks[price])
+
+
+def _apply_levels(
+    book: Dict[float, float],
+    prices: list[float],
+    levels: Iterable[BookLevel],
+    size_sum: float,
+    removed: int,
+) -> tuple[float, int]:
+    for level in levels:
+        price = level.price
+        size = level.size
+        size_sum += abs(size)
+        if size == 0:
+            removed += 1
+            if price in book:
+                del book[price]
+                del prices[bisect_left(prices, price)]
+        else:
+            if price not in book:
+                insort(prices, price)
+            book[price] = size
+    return size_sum, removed
+
+
+def _level_totals(levels: Iterable[BookLevel], size_sum: float, removed: int) -> tuple[float, int]:
+    for level in levels:
+        size = level.size
+        size_sum += abs(size)
+        if size == 0:
+            removed += 1
+    return size_sum, removed
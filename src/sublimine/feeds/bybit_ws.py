@@ -2,11 +2,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 import json
+import sys
 import threading
 import time
 from typing import Any, Callable
 
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - exercised without orjson installed
+    orjson = None
+
 try:
     import websocket  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover - exercised in live environments
@@ -17,13 +24,14 @@ from sublimine.feeds.book import OrderBook
 from sublimine.feeds.ws_common import ReconnectPolicy
 
 
+_loads = orjson.loads if orjson is not None else json.loads
+
+
 def _parse_levels(raw_levels: list[list[Any]]) -> list[BookLevel]:
-    levels: list[BookLevel] = []
-    for price, size in raw_levels:
-        levels.append(BookLevel(price=float(price), size=float(size)))
-    return levels
+    return [BookLevel(float(price), float(size)) for price, size in raw_levels]
 
 
+@lru_cache(maxsize=4096)
 def _ts_from_ms(ms: int) -> datetime:
     return datetime.fromtimestamp(ms / 1000.0, tz=timezone.utc)
 
@@ -40,6 +48,7 @@ def parse_bybit_message(msg: dict) -> BookSnapshot | BookDelta | None:
     symbol = data.get("s")
     if symbol is None:
         return None
+    symbol = sys.intern(symbol)
 
     ts_ms = msg.get("ts")
     if ts_ms is None:
@@ -88,6 +97,7 @@ def parse_bybit_trade_message(msg: dict) -> list[TradePrint] | None:
         symbol = item.get("s")
         if symbol is None:
             continue
+        symbol = sys.intern(symbol)
         ts_ms = item.get("T") or msg.get("ts")
         if ts_ms is None:
             continue
@@ -173,7 +183,7 @@ class BybitConnector:
         if self._sink is None:
             return
         try:
-            payload = json.loads(message)
+            payload = _loads(message)
         except json.JSONDecodeError:
             return
 
@@ -24,12 +24,14 @@ class LiveRunner:
         bus: EventBus,
         connectors: Iterable[object],
         on_tick: Callable[[], None] | None = None,
+        max_batch: int = 1,
     ) -> None:
         self._bus = bus
         self._connectors = list(connectors)
         self._queue: queue.Queue[LiveEvent] = queue.Queue()
         self._stop_event = threading.Event()
         self._on_tick = on_tick
+        self._max_batch = max(1, int(max_batch))
 
     @property
     def sink(self) -> EventSink:
@@ -41,15 +43,27 @@ class LiveRunner:
     def run(self) -> None:
         for connector in self._connectors:
             connector.start(self.sink)
+        publish = self._bus.publish
+        get_nowait = self._queue.get_nowait
+        stopped = self._stop_event.is_set
+        extra = range(self._max_batch - 1)
         try:
-            while not self._stop_event.is_set():
+            while not stopped():
                 if self._on_tick is not None:
                     self._on_tick()
                 try:
                     event = self._queue.get(timeout=0.5)
                 except queue.Empty:
                     continue
-                self._bus.publish(event.event_type, event.payload)
+                publish(event.event_type, event.payload)
+                for _ in extra:
+                    if stopped():
+                        break
+                    try:
+                        event = get_nowait()
+                    except queue.Empty:
+                        break
+                    publish(event.event_type, event.payload)
         finally:
             self.stop()
 
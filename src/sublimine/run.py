@@ -171,18 +171,16 @@ def build_pipeline(
             bus.publish(EventType.ENGINE_STATE, state_event)
         if guard.current_state in {EngineState.FREEZE, EngineState.KILL}:
             block_reason = "engine_freeze_block" if guard.current_state == EngineState.FREEZE else "engine_kill_block"
-            blocked_meta = dict(signal.meta)
-            blocked_meta.update(
-                {
-                    "consensus_dt_ms": dt_ms,
-                    "health_state": guard.current_state.value,
-                    "health_score": snap.score_0_1,
-                    "health_reasons": list(snap.reason_codes),
-                    "mid_diff_bps": snap.mid_diff_bps,
-                    "queue_depth": snap.queue_depth,
-                    "blocked_by_engine_state": True,
-                }
-            )
+            blocked_meta = {
+                **signal.meta,
+                "consensus_dt_ms": dt_ms,
+                "health_state": guard.current_state.value,
+                "health_score": snap.score_0_1,
+                "health_reasons": list(snap.reason_codes),
+                "mid_diff_bps": snap.mid_diff_bps,
+                "queue_depth": snap.queue_depth,
+                "blocked_by_engine_state": True,
+            }
             blocked = SignalEvent(
                 event_name=signal.event_name,
                 symbol=signal.symbol,
@@ -222,8 +220,7 @@ def build_pipeline(
             "scores": {venue.value: scores_by_venue[venue] for venue in (Venue.BYBIT, Venue.BINANCE) if venue in scores_by_venue},
             "dt_ms": dt_ms,
         }
-        merged_meta = dict(consensus_signal.meta)
-        merged_meta.update(intent.meta)
+        merged_meta = {**consensus_signal.meta, **intent.meta}
         for key in ("setup", "direction"):
             if key in consensus_signal.meta:
                 merged_meta[key] = consensus_signal.meta[key]
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 
 from sublimine.contracts.types import SignalEvent, Side, TradeIntent
 
+_DIRECTIONS = {"BUY": Side.BUY, "SELL": Side.SELL}
+
 
 @dataclass
 class BTCPlaybook:
@@ -14,11 +16,14 @@ class BTCPlaybook:
             return None
 
         direction_meta = signal.meta.get("direction")
+        direction: Side | None = None
         if isinstance(direction_meta, Side):
             direction = direction_meta
-        elif isinstance(direction_meta, str) and direction_meta.strip().upper() in {"BUY", "SELL"}:
-            direction = Side(direction_meta.strip().upper())
-        else:
+        elif isinstance(direction_meta, str):
+            direction = _DIRECTIONS.get(direction_meta)
+            if direction is None:
+                direction = _DIRECTIONS.get(direction_meta.strip().upper())
+        if direction is None:
             direction = Side.BUY
             bias = signal.meta.get("microprice_bias")
             if isinstance(bias, (int, float)) and bias < 0:
@@ -123,3 +123,29 @@ def test_binance_reset_clears_buffer():
     )
     sync.apply_snapshot(snapshot, last_update_id=100)
     assert sync.book.best_bid().price == 100.0
+
+
+def test_binance_buffered_events_replay_in_update_order():
+    sync = BinanceBookSynchronizer(symbol="BTCUSDT", depth=5)
+    later = parse_binance_diff_event(
+        {"e": "depthUpdate", "E": 1700000001000, "s": "BTCUSDT", "U": 106, "u": 110, "b": [["100", "3"]], "a": []}
+    )
+    first = parse_binance_diff_event(
+        {"e": "depthUpdate", "E": 1700000000000, "s": "BTCUSDT", "U": 95, "u": 105, "b": [["100", "2"]], "a": []}
+    )
+    sync.on_diff_event(later)
+    sync.on_diff_event(first)
+
+    snapshot = BookSnapshot(
+        symbol="BTCUSDT",
+        venue=Venue.BINANCE,
+        ts_utc=datetime(2023, 1, 1, tzinfo=timezone.utc),
+        bids=[BookLevel(100.0, 1.0)],
+        asks=[BookLevel(101.0, 1.0)],
+        depth=5,
+    )
+    applied = sync.apply_snapshot(snapshot, last_update_id=100)
+    assert applied == [first.delta, later.delta]
+    assert sync.last_update_id == 110
+    assert sync.book.bids[100.0] == 3.0
+    assert sync.needs_resync() is False
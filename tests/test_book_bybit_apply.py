@@ -1,4 +1,8 @@
-from sublimine.contracts.types import Venue
+from datetime import datetime, timezone
+
+import pytest
+
+from sublimine.contracts.types import BookDelta, BookLevel, BookSnapshot, Side, Venue
 from sublimine.feeds.book import OrderBook
 from sublimine.feeds.bybit_ws import parse_bybit_message
 
@@ -60,3 +64,53 @@ def test_bybit_u_equals_one_forces_snapshot():
     delta = parse_bybit_message(delta_msg)
     assert delta is not None
     assert delta.is_snapshot is True
+
+
+def test_bybit_delta_reports_size_and_removed_levels():
+    book = OrderBook.empty("BTCUSDT", Venue.BYBIT, depth=5)
+    book.apply_snapshot(
+        BookSnapshot(
+            symbol="BTCUSDT",
+            venue=Venue.BYBIT,
+            ts_utc=datetime(2023, 1, 1, tzinfo=timezone.utc),
+            bids=[BookLevel(100.0, 1.0), BookLevel(99.0, 1.0)],
+            asks=[BookLevel(101.0, 1.0)],
+            depth=5,
+        )
+    )
+    delta = BookDelta(
+        symbol="BTCUSDT",
+        venue=Venue.BYBIT,
+        ts_utc=datetime(2023, 1, 1, 0, 0, 1, tzinfo=timezone.utc),
+        bids=[BookLevel(99.0, 0.0), BookLevel(98.5, 2.0)],
+        asks=[BookLevel(101.0, 0.0), BookLevel(101.5, 3.0)],
+        is_snapshot=False,
+        update_id=2,
+    )
+    assert book.apply_delta(delta) == (5.0, 2)
+    empty = BookDelta(
+        symbol="BTCUSDT",
+        venue=Venue.BYBIT,
+        ts_utc=datetime(2023, 1, 1, 0, 0, 2, tzinfo=timezone.utc),
+        bids=[],
+        asks=[],
+        is_snapshot=False,
+        update_id=3,
+    )
+    assert repr(book.apply_delta(empty)) == "(0, 0)"
+    assert 99.0 not in book.bids
+    assert 101.0 not in book.asks
+
+
+def test_book_levels_are_read_only_views():
+    seed = {100.0: 1.0, 99.0: 2.0}
+    book = OrderBook("BTCUSDT", Venue.BYBIT, depth=5, bids=seed, asks={101.0: 1.0})
+    seed[101.0] = 9.0
+
+    with pytest.raises(TypeError):
+        book.bids[98.0] = 1.0  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        book.asks = {}  # type: ignore[misc]
+
+    assert book.best_bid() == BookLevel(100.0, 1.0)
+    assert book.top_n_columns(Side.BUY, 5) == ([100.0, 99.0], [1.0, 2.0])
@@ -0,0 +1,60 @@
+import tempfile
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+import yaml
+
+from sublimine.config import clear_config_cache, load_config
+
+
+def _write(path: Path, signal_score_min: float) -> None:
+    data = {
+        "symbols": {"leader": "BTCUSDT", "exec": "BTCUSD_CFD"},
+        "thresholds": {
+            "window": 5,
+            "depth_k": 1,
+            "quantile_high": 0.6,
+            "quantile_low": 0.4,
+            "min_samples": 2,
+            "signal_score_min": signal_score_min,
+        },
+        "risk_phases": {"F0": {"risk_frac": 0.002, "max_daily_loss": 0.01}},
+    }
+    path.write_text(yaml.safe_dump(data), encoding="utf-8")
+
+
+def test_load_config_reuses_cached_instance_until_file_changes():
+    path = Path(tempfile.gettempdir()) / f"sublimine_config_{uuid4().hex}.yaml"
+    _write(path, 0.2)
+    try:
+        first = load_config(str(path))
+        assert load_config(str(path)) is first
+
+        _write(path, 0.25)
+        reloaded = load_config(str(path))
+        assert reloaded is not first
+        assert reloaded.thresholds.signal_score_min == 0.25
+
+        clear_config_cache()
+        assert load_config(str(path)) is not reloaded
+    finally:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def test_cached_config_risk_phases_are_read_only():
+    path = Path(tempfile.gettempdir()) / f"sublimine_config_{uuid4().hex}.yaml"
+    _write(path, 0.2)
+    try:
+        config = load_config(str(path))
+        with pytest.raises(TypeError):
+            config.risk.phases["F9"] = config.risk.phases["F0"]  # type: ignore[index]
+        assert list(load_config(str(path)).risk.phases) == ["F0"]
+    finally:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,33 @@
+from sublimine.contracts.types import EventType
+from sublimine.core.bus import EventBus
+
+
+def test_publish_calls_handlers_in_subscription_order():
+    bus = EventBus()
+    seen = []
+    bus.subscribe(EventType.TRADE, lambda payload: seen.append(("a", payload)))
+    bus.subscribe(EventType.TRADE, lambda payload: seen.append(("b", payload)))
+
+    bus.publish(EventType.TRADE, 1)
+    bus.publish(EventType.QUOTE, 2)
+
+    assert seen == [("a", 1), ("b", 1)]
+
+
+def test_subscribe_during_publish_applies_to_next_event():
+    bus = EventBus()
+    seen = []
+
+    def late(payload):
+        seen.append(("late", payload))
+
+    def first(payload):
+        seen.append(("first", payload))
+        if payload == 1:
+            bus.subscribe(EventType.TRADE, late)
+
+    bus.subscribe(EventType.TRADE, first)
+    bus.publish(EventType.TRADE, 1)
+    bus.publish(EventType.TRADE, 2)
+
+    assert seen == [("first", 1), ("first", 2), ("late", 2)]
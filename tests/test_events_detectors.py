@@ -1,7 +1,9 @@
+import math
+import random
 from datetime import datetime, timezone
 
 from sublimine.contracts.types import Venue
-from sublimine.events.detectors import DetectorConfig, DetectorEngine
+from sublimine.events.detectors import DetectorConfig, DetectorEngine, RollingQuantile
 from sublimine.features.feature_engine import FeatureFrame
 
 
@@ -37,3 +39,29 @@ def test_e1_detector_triggers():
     signals = detector.evaluate(_frame(ts, 70.0, 0.5, 0.5))
 
     assert any(signal.event_name == "E1" for signal in signals)
+
+
+def test_rolling_quantile_matches_sorted_window():
+    window = 7
+    rq = RollingQuantile(window)
+    values = [3.0, -1.0, 2.5, 2.5, 9.0, 0.0, -4.0, 7.5, 2.5, 1.0, -1.0, 6.0, 3.0, 0.5]
+    for idx, value in enumerate(values):
+        rq.update(value)
+        expected = sorted(values[max(0, idx + 1 - window) : idx + 1])
+        for q in (0.0, 0.2, 0.5, 0.8, 1.0):
+            assert rq.quantile(q) == expected[int(q * (len(expected) - 1))]
+
+
+def test_rolling_quantile_matches_sorted_window_with_nans():
+    rng = random.Random(7)
+    pool = [math.nan, math.inf, -math.inf, 0.0, -0.0, 1.0, -1.0, 2.5]
+    for window in (1, 3, 16):
+        rq = RollingQuantile(window)
+        values = []
+        for _ in range(2000):
+            value = rng.choice(pool) if rng.random() < 0.6 else rng.uniform(-5.0, 5.0)
+            values.append(value)
+            rq.update(value)
+            expected = sorted(values[-window:])
+            for q in (0.0, 0.2, 0.5, 0.8, 1.0):
+                assert repr(rq.quantile(q)) == repr(expected[int(q * (len(expected) - 1))])
@@ -1,8 +1,10 @@
 from datetime import datetime, timezone
+import math
+import random
 
-from sublimine.contracts.types import BookLevel, BookSnapshot, Venue
+from sublimine.contracts.types import BookLevel, BookSnapshot, Side, Venue
 from sublimine.features.book_features import compute_book_features
-from sublimine.features.ofi import OFIState
+from sublimine.features.ofi import OFIState, RollingStats
 from sublimine.feeds.book import OrderBook
 
 
@@ -35,3 +37,62 @@ def test_ofi_state():
     ask2 = BookLevel(101.0, 1.0)
     ofi_value, _ = ofi.update(bid2, ask2)
     assert ofi_value == 1.0
+
+
+def _two_pass(window: list[float]) -> tuple[float, float]:
+    mean = sum(window) / len(window)
+    var = sum((v - mean) ** 2 for v in window) / len(window)
+    return mean, math.sqrt(var)
+
+
+def _adversarial_values(rng: random.Random, count: int) -> list[float]:
+    values: list[float] = []
+    for i in range(count):
+        if i % 150 < 60:
+            values.append(0.1)
+        elif i % 97 == 0:
+            values.append(1e6 + rng.gauss(0, 1))
+        elif i % 41 == 0:
+            values.append(rng.choice([1e-300, -1e150, 2.5]))
+        else:
+            values.append(rng.gauss(0, rng.choice([1e-6, 1.0, 100.0])))
+    return values
+
+
+def test_rolling_stats_matches_two_pass_exactly():
+    rng = random.Random(7)
+    for window_size in (1, 2, 20, 64):
+        stats = RollingStats(window=window_size)
+        window: list[float] = []
+        for value in _adversarial_values(rng, 600):
+            stats.update(value)
+            window = (window + [value])[-window_size:]
+            expected_mean, expected_std = _two_pass(window)
+            assert stats.mean_std() == (expected_mean, expected_std)
+            expected_z = 0.0 if expected_std == 0 else (value - expected_mean) / expected_std
+            assert stats.zscore(value) == expected_z
+
+
+def test_depth_slope_and_convexity():
+    book = OrderBook.empty("BTCUSDT", Venue.BYBIT, depth=3)
+    book.apply_snapshot(
+        BookSnapshot(
+            symbol="BTCUSDT",
+            venue=Venue.BYBIT,
+            ts_utc=datetime(2023, 1, 1, tzinfo=timezone.utc),
+            bids=[BookLevel(99.0, 2.0), BookLevel(100.0, 1.0), BookLevel(98.0, 3.0)],
+            asks=[BookLevel(102.0, 5.0), BookLevel(101.0, 4.0)],
+            depth=3,
+        )
+    )
+    prices, sizes = book.top_n_columns(Side.BUY, 2)
+    assert (prices, sizes) == ([100.0, 99.0], [1.0, 2.0])
+    assert [(level.price, level.size) for level in book.top_n(Side.BUY, 2)] == list(zip(prices, sizes))
+
+    features = compute_book_features(book, depth_k=2, ts_utc=datetime(2023, 1, 1, tzinfo=timezone.utc))
+    assert features is not None
+    assert features.depth_near == 12.0
+    assert abs(features.imbalance - (3.0 - 9.0) / 12.0) < 1e-12
+    weighted = 0.5 * 1.0 + 1.5 * 2.0 + 0.5 * 4.0 + 1.5 * 5.0
+    assert abs(features.slope - 1.0 / (weighted / 12.0 + 1e-9)) < 1e-9
+    assert features.convexity == (1.0 + 4.0) / 12.0
@@ -10,6 +10,13 @@ def test_id_generator_increments():
     assert gen.next_id() == "t_000002"
 
 
+def test_id_generator_follows_prefix_changes():
+    gen = IdGenerator("a_")
+    assert gen.next_id() == "a_000001"
+    gen.prefix = "b%_"
+    assert gen.next_id() == "b%_000002"
+
+
 def test_run_id_uses_timestamp():
     ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
     assert run_id(ts).startswith("run_20240101T000000")
@@ -0,0 +1,213 @@
+import json
+import math
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import uuid4
+
+from sublimine.contracts.types import BookDelta, BookLevel, BookSnapshot, EventType, SignalEvent, Side, TradePrint, Venue
+from sublimine.core.journal import JournalWriter, encode_record, iter_events
+
+
+def _journal_path() -> Path:
+    return Path(tempfile.gettempdir()) / f"sublimine_journal_{uuid4().hex}.jsonl"
+
+
+def _events():
+    ts = datetime(2023, 1, 1, 0, 0, 0, 250000, tzinfo=timezone.utc)
+    return [
+        (
+            EventType.BOOK_SNAPSHOT,
+            BookSnapshot(
+                symbol="BTCUSDT",
+                venue=Venue.BYBIT,
+                ts_utc=ts,
+                bids=[BookLevel(100.0, 5.0), BookLevel(99.5, 1.25)],
+                asks=[BookLevel(101.0, 4.0)],
+                depth=2,
+            ),
+        ),
+        (
+            EventType.BOOK_DELTA,
+            BookDelta(
+                symbol="BTCUSDT",
+                venue=Venue.BINANCE,
+                ts_utc=ts,
+                bids=[BookLevel(100.0, 0.0)],
+                asks=[],
+                is_snapshot=False,
+                update_id=42,
+            ),
+        ),
+        (
+            EventType.TRADE,
+            TradePrint(
+                symbol="BTCUSDT",
+                venue=Venue.BYBIT,
+                ts_utc=ts,
+                price=100.5,
+                size=0.1,
+                aggressor_side=Side.SELL,
+            ),
+        ),
+        (
+            EventType.EVENT_SIGNAL,
+            SignalEvent(
+                event_name="E2",
+                symbol="BTCUSDT",
+                venue=Venue.BYBIT,
+                ts_utc=ts,
+                score_0_1=0.75,
+                reason_codes=["SAF", "saf_confirmed"],
+                meta={"setup": "SAF", "direction": "SELL", "level": 110.0},
+            ),
+        ),
+    ]
+
+
+def test_journal_roundtrip_restores_payloads():
+    path = _journal_path()
+    events = _events()
+    writer = JournalWriter(str(path))
+    try:
+        for event_type, payload in events:
+            writer.append(event_type, payload)
+    finally:
+        writer.close()
+
+    try:
+        assert list(iter_events(str(path))) == events
+    finally:
+        path.unlink()
+
+
+def test_journal_roundtrip_keeps_non_finite_floats_and_wide_ints():
+    path = _journal_path()
+    ts = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    trade = TradePrint(
+        symbol="BTCUSDT",
+        venue=Venue.BYBIT,
+        ts_utc=ts,
+        price=float("inf"),
+        size=float("nan"),
+        aggressor_side=Side.BUY,
+    )
+    signal = SignalEvent(
+        event_name="E1",
+        symbol="BTCUSDT",
+        venue=Venue.BINANCE,
+        ts_utc=ts,
+        score_0_1=float("-inf"),
+        reason_codes=[],
+        meta={"seq": 2**70, "z": float("nan"), "prev": None, "note": "caf\u00e9"},
+    )
+    writer = JournalWriter(str(path))
+    try:
+        writer.append(EventType.TRADE, trade)
+        writer.append(EventType.EVENT_SIGNAL, signal)
+    finally:
+        writer.close()
+
+    try:
+        (_, trade_out), (_, signal_out) = list(iter_events(str(path)))
+        assert trade_out.price == float("inf")
+        assert math.isnan(trade_out.size)
+        assert signal_out.score_0_1 == float("-inf")
+        assert signal_out.meta["seq"] == 2**70
+        assert math.isnan(signal_out.meta["z"])
+        assert signal_out.meta["prev"] is None
+        assert signal_out.meta["note"] == "caf\u00e9"
+        assert b'"note":"caf\\u00e9"' in path.read_bytes()
+    finally:
+        path.unlink()
+
+
+def test_journal_writer_flushes_each_append():
+    path = _journal_path()
+    event_type, payload = _events()[2]
+    writer = JournalWriter(str(path))
+    try:
+        writer.append(event_type, payload)
+        assert len(list(iter_events(str(path)))) == 1
+    finally:
+        writer.close()
+        path.unlink()
+
+
+def test_journal_writes_iso_timestamps():
+    path = _journal_path()
+    event_type, payload = _events()[2]
+    writer = JournalWriter(str(path))
+    try:
+        writer.append(event_type, payload)
+    finally:
+        writer.close()
+
+    try:
+        assert b'"ts_utc":"2023-01-01T00:00:00.250000+00:00"' in path.read_bytes()
+    finally:
+        path.unlink()
+
+
+def test_encode_record_is_json_native_and_matches_writer():
+    path = _journal_path()
+    events = _events()
+    writer = JournalWriter(str(path))
+    try:
+        for event_type, payload in events:
+            writer.append(event_type, payload)
+    finally:
+        writer.close()
+
+    try:
+        written = [json.loads(line) for line in path.read_bytes().splitlines()]
+        encoded = [json.loads(json.dumps(encode_record(event_type, payload))) for event_type, payload in events]
+        assert encoded == written
+        assert encoded[0]["data"]["ts_utc"] == "2023-01-01T00:00:00.250000+00:00"
+    finally:
+        path.unlink()
+
+
+def test_journal_keeps_sub_minute_utc_offsets():
+    path = _journal_path()
+    ts = datetime(2023, 1, 1, 0, 0, 0, 250000, tzinfo=timezone(timedelta(hours=5, seconds=30)))
+    trade = TradePrint(
+        symbol="BTCUSDT",
+        venue=Venue.BYBIT,
+        ts_utc=ts,
+        price=100.5,
+        size=0.1,
+        aggressor_side=Side.SELL,
+    )
+    writer = JournalWriter(str(path))
+    try:
+        writer.append(EventType.TRADE, trade)
+    finally:
+        writer.close()
+
+    try:
+        assert b'"ts_utc":"2023-01-01T00:00:00.250000+05:00:30"' in path.read_bytes()
+        assert list(iter_events(str(path))) == [(EventType.TRADE, trade)]
+    finally:
+        path.unlink()
+
+
+def test_iter_events_filters_before_decoding():
+    path = _journal_path()
+    events = _events()
+    writer = JournalWriter(str(path))
+    try:
+        for event_type, payload in events:
+            writer.append(event_type, payload)
+    finally:
+        writer.close()
+
+    with open(path, "ab") as handle:
+        handle.write(b'{"data":{"ts_utc":"2023-01-01T00:00:00+00:00"},"event_type":"ENGINE_STATE"}\n')
+        handle.write(b'{"event_type":"NOT_AN_EVENT","data":{}}\n')
+
+    try:
+        wanted = {EventType.TRADE, EventType.EVENT_SIGNAL}
+        assert list(iter_events(str(path), wanted)) == [event for event in events if event[0] in wanted]
+    finally:
+        path.unlink()
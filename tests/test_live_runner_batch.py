@@ -0,0 +1,59 @@
+from sublimine.contracts.types import EventType
+from sublimine.core.bus import EventBus
+from sublimine.live import LiveRunner
+
+
+class _BurstConnector:
+    def __init__(self, count: int) -> None:
+        self._count = count
+
+    def start(self, sink) -> None:
+        for idx in range(self._count):
+            sink(EventType.TRADE, idx)
+
+    def stop(self) -> None:
+        return None
+
+    def join(self) -> None:
+        return None
+
+
+def _run(count: int, stop_after: int, **kwargs) -> tuple[list, list]:
+    bus = EventBus()
+    seen = []
+    ticks = []
+    runner: LiveRunner
+
+    def on_trade(payload) -> None:
+        seen.append(payload)
+        if len(seen) == stop_after:
+            runner.stop()
+
+    def on_tick() -> None:
+        ticks.append(runner.queue_depth())
+
+    bus.subscribe(EventType.TRADE, on_trade)
+    runner = LiveRunner(bus, [_BurstConnector(count)], on_tick=on_tick, **kwargs)
+    runner.run()
+    return seen, ticks
+
+
+def test_live_runner_ticks_once_per_event_by_default():
+    seen, ticks = _run(10, 10)
+
+    assert seen == list(range(10))
+    assert ticks == list(range(10, 0, -1))
+
+
+def test_live_runner_drains_bursts_in_order_with_one_tick_per_batch():
+    seen, ticks = _run(10, 10, max_batch=4)
+
+    assert seen == list(range(10))
+    assert ticks == [10, 6, 2]
+
+
+def test_live_runner_stops_draining_batch_after_stop():
+    seen, ticks = _run(10, 2, max_batch=8)
+
+    assert seen == [0, 1]
+    assert ticks == [10]
@@ -61,7 +61,7 @@ def test_afs_emits_on_acceptance_failure_return_inside():
     for idx, bar in enumerate(bars):
         signals = engine.on_bar(bar)
         if idx < len(bars) - 1:
-            assert signals == []
+            assert list(signals) == []
         emitted.extend(signals)
 
     assert len(emitted) == 1
@@ -56,7 +56,7 @@ def test_dlv_emits_only_on_pause_breakout():
     for idx, bar in enumerate(bars):
         signals = engine.on_bar(bar)
         if idx < len(bars) - 1:
-            assert signals == []
+            assert list(signals) == []
         emitted.extend(signals)
 
     assert len(emitted) == 1
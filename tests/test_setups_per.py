@@ -70,7 +70,7 @@ def test_per_emits_on_first_hl_break_after_bounded_pullback():
     for idx, bar in enumerate(bars):
         signals = engine.on_bar(bar)
         if idx < len(bars) - 1:
-            assert signals == []
+            assert list(signals) == []
         emitted.extend(signals)
 
     assert len(emitted) == 1
@@ -102,7 +102,7 @@ def test_saf_emits_after_fatigue_and_structure_break():
     for idx, bar in enumerate(bars):
         signals = engine.on_bar(bar)
         if idx < len(bars) - 1:
-            assert signals == []
+            assert list(signals) == []
         emitted.extend(signals)
 
     assert len(emitted) == 1